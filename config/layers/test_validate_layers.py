@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Tests for validate_layers.py.
+
+Usage:
+    python -m unittest test_validate_layers     # from config/layers/
+"""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from validate_layers import (  # noqa: E402
+    load_style_files,
+    load_yaml_file,
+    parse_yaml_files,
+    validate_file,
+    validate_file_streaming,
+)
+
+LAYER_DIR = Path(__file__).parent
+STYLE_FILES = load_style_files(LAYER_DIR.parent / "styles")
+
+# Files that exercise the streaming and batched paths' fallbacks and error handling
+MALFORMED_FILES = {
+    "syntax_error.yaml": "model: gfs\nlayers:\n  - id: gfs_tmp\n    title: [unclosed\n",
+    "empty.yaml": "",
+    "not_a_mapping.yaml": "- model: gfs\n",
+    "layers_first.yaml": "layers:\n  - id: gfs_tmp\nmodel: gfs\ndisplay_name: GFS\n",
+    "layers_not_list.yaml": "model: gfs\ndisplay_name: GFS\nlayers: {id: gfs_tmp}\n",
+    "missing_fields.yaml": "model: gfs\nlayers:\n  - id: hrrr_tmp\n  - 3\n  - {}\n",
+    "multi_document.yaml": "model: gfs\ndisplay_name: GFS\nlayers: []\n---\nmodel: hrrr\n",
+    "directive.yaml": "%YAML 1.1\n---\nmodel: gfs\n",
+    "document_end.yaml": "model: gfs\n...\n",
+    "comment_only.yaml": "# nothing here",
+    "anchors.yaml": (
+        "model: gfs\n"
+        "display_name: GFS\n"
+        "units: &units {native: K}\n"
+        "layers:\n"
+        "  - &tmp\n"
+        "    id: gfs_tmp\n"
+        "    parameter: TMP\n"
+        "    title: Temperature\n"
+        "    style_file: missing.json\n"
+        "    units: *units\n"
+        "    levels: [{value: 2 m above ground, default: yes}]\n"
+        "  - *tmp\n"
+        "  - {<<: *tmp, id: gfs_dpt, levels: []}\n"
+    ),
+}
+
+
+def validate_loaded(filepath: Path):
+    errors = []
+    data = load_yaml_file(filepath, errors)
+    return validate_file(filepath, data, errors, STYLE_FILES)
+
+
+class StreamingValidationTest(unittest.TestCase):
+    """validate_file_streaming must report exactly what validate_file does."""
+
+    def assertSameResult(self, filepath: Path) -> None:
+        self.assertEqual(
+            validate_file_streaming(filepath, STYLE_FILES), validate_loaded(filepath)
+        )
+
+    def test_repo_layer_files(self):
+        layer_files = sorted(LAYER_DIR.glob("*.yaml"))
+        self.assertTrue(layer_files)
+        for filepath in layer_files:
+            with self.subTest(file=filepath.name):
+                self.assertSameResult(filepath)
+
+    def test_malformed_files(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            for name, text in MALFORMED_FILES.items():
+                filepath = Path(tmp) / name
+                filepath.write_text(text)
+                with self.subTest(file=name):
+                    self.assertSameResult(filepath)
+
+
+class BatchedParseTest(unittest.TestCase):
+    """parse_yaml_files must match loading each file on its own."""
+
+    def assertSameParse(self, filepaths: list[Path]) -> None:
+        expected = []
+        for filepath in filepaths:
+            errors = []
+            expected.append((load_yaml_file(filepath, errors), errors))
+        self.assertEqual(parse_yaml_files(filepaths), expected)
+
+    def test_repo_layer_files(self):
+        self.assertSameParse(sorted(LAYER_DIR.glob("*.yaml")))
+
+    def test_malformed_files(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            filepaths = []
+            for name, text in MALFORMED_FILES.items():
+                filepath = Path(tmp) / name
+                filepath.write_text(text)
+                filepaths.append(filepath)
+            filepaths.append(Path(tmp) / "missing.yaml")
+            # Put the bad files between good ones so the stream resumes
+            repo_files = sorted(LAYER_DIR.glob("*.yaml"))
+            mixed = [f for pair in zip(repo_files * 3, filepaths) for f in pair]
+            self.assertSameParse(mixed)
+
+
+if __name__ == "__main__":
+    unittest.main()
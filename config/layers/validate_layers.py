@@ -9,12 +9,23 @@ Checks:
 - Referenced style files exist
 - Layer IDs follow naming convention ({model}_{parameter})
 - Each layer has at least one level with a default
+
+Usage:
+    ./validate_layers.py                  # Validate all layer files
+    ./validate_layers.py --model gfs      # Only validate files for a model
 """
 
+import codecs
 import sys
 import os
+import hashlib
+import json
+import pickle
+import re
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice, repeat
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
 try:
     import yaml
@@ -23,164 +34,667 @@ except ImportError:
     sys.exit(1)
 
 
+# Prefer the libyaml-backed loader; fall back to pure Python if unavailable
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 REQUIRED_LAYER_FIELDS = ["id", "parameter", "title", "style_file"]
 REQUIRED_MODEL_FIELDS = ["model", "display_name", "layers"]
+_REQUIRED_LAYER_FIELDS_SET = frozenset(REQUIRED_LAYER_FIELDS)
+_REQUIRED_MODEL_FIELDS_SET = frozenset(REQUIRED_MODEL_FIELDS)
+
+# Errors and warnings are kept as (template, args) and only formatted when
+# printed, so building up a large batch of them stays cheap
+Message = tuple[str, tuple[Any, ...]]
+
+# Files larger than this are validated from the YAML event stream so that
+# only one layer is in memory at a time
+STREAMING_THRESHOLD_BYTES = 1024 * 1024
+
+# Layer files take about a millisecond each to validate, so a worker pool
+# only pays for its startup once there are this many of them
+PARALLEL_MIN_FILES = 32
+
+# Files containing any of these can't be joined into one multi-document
+# stream: document markers and directives at the start of a line, which
+# would split or re-scope the stream, and byte order marks
+DOC_MARKER_RE = re.compile(rb"^(?:---|\.\.\.)(?:[ \t\r\n]|$)|^%", re.MULTILINE)
+UNICODE_BOMS = (codecs.BOM_UTF8, codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)
+
+# Parsed YAML is cached here when --cache is given
+CACHE_DIR_NAME = ".validate_cache"
+
+# The top-level "model:" key sits in the file header, after the comment block
+MODEL_HEADER_BYTES = 1024
+MODEL_HEADER_RE = re.compile(rb"^model:[ \t]*[\"']?([\w.-]+)", re.MULTILINE)
+
+
+def yaml_syntax_error(filepath: Path, e: yaml.YAMLError) -> Message:
+    """Describe a YAML error, naming the file rather than the parser's input."""
+    # libyaml's marks are read-only, so swap in equivalent pure-Python ones
+    for attr in ("context_mark", "problem_mark"):
+        mark = getattr(e, attr, None)
+        if mark is not None:
+            renamed = yaml.Mark(
+                filepath.name, mark.index, mark.line, mark.column, None, 0
+            )
+            setattr(e, attr, renamed)
+    return ("Invalid YAML syntax in %s\n         %s", (filepath.name, str(e)))
 
 
-def load_yaml_file(filepath: Path) -> dict | None:
-    """Load and parse a YAML file, returning None on error."""
+def load_yaml_file(filepath: Path, errors: list[Message]) -> Any:
+    """Load and parse a YAML file, returning None (and recording why) on error."""
     try:
-        with open(filepath, "r") as f:
-            return yaml.safe_load(f)
+        return yaml.load(filepath.read_bytes(), Loader=YAML_LOADER)
     except yaml.YAMLError as e:
-        print(f"  ERROR: Invalid YAML syntax in {filepath.name}")
-        print(f"         {e}")
+        errors.append(yaml_syntax_error(filepath, e))
         return None
     except Exception as e:
-        print(f"  ERROR: Could not read {filepath.name}: {e}")
+        errors.append(("Could not read %s: %s", (filepath.name, str(e))))
+        return None
+
+
+def yaml_cache_key(filepath: Path) -> tuple[str, int, int] | None:
+    """Return the (path, mtime_ns, size) key identifying a file's contents."""
+    try:
+        st = os.stat(filepath)
+    except OSError:
         return None
+    return str(filepath.resolve()), st.st_mtime_ns, st.st_size
+
+
+def read_yaml_cache(cache_file: Path, key: tuple[str, int, int]) -> tuple[bool, Any]:
+    """Return (hit, data) for a cached parse of a file with the given key."""
+    try:
+        with open(cache_file, "rb") as f:
+            cached_key, data = pickle.load(f)
+    except Exception:
+        return False, None
+    return cached_key == key, data
+
+
+def write_yaml_cache(cache_file: Path, key: tuple[str, int, int], data: Any) -> None:
+    """Store a parsed file in the cache, ignoring write failures."""
+    try:
+        with open(cache_file, "wb") as f:
+            pickle.dump((key, data), f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass
+
+
+def read_json_sidecar(filepath: Path, digest: str) -> tuple[bool, Any]:
+    """Return (hit, data) from a JSON copy of a YAML file.
+
+    The ``.json`` sidecar records the SHA-256 of the YAML it was rendered
+    from and is only used while that still matches the file's contents.
+    """
+    try:
+        sidecar = json.loads(filepath.with_suffix(".json").read_bytes())
+    except (OSError, ValueError):
+        return False, None
+    if not isinstance(sidecar, dict) or sidecar.get("sha256") != digest:
+        return False, None
+    return True, sidecar.get("data")
+
+
+def write_json_sidecar(filepath: Path, digest: str, data: Any) -> None:
+    """Store a parsed file as a JSON sidecar, if it survives a JSON round trip."""
+    try:
+        text = json.dumps({"sha256": digest, "data": data})
+        if json.loads(text)["data"] != data:
+            return
+        filepath.with_suffix(".json").write_text(text)
+    except (OSError, TypeError, ValueError):
+        pass
+
+
+def load_yaml_files(
+    filepaths: list[Path], cache_dir: Path | None = None, json_sidecar: bool = False
+) -> list[tuple[Any, list[Message]]]:
+    """Load several YAML files, returning (data, errors) for each.
+
+    With a ``cache_dir``, files whose (path, mtime, size) match a previous
+    run are returned from the cache. With ``json_sidecar``, a JSON sidecar
+    rendered from the same YAML bytes is used instead of parsing, and one is
+    written for each file that had to be parsed.
+    """
+    results: dict[Path, tuple[Any, list[Message]]] = {}
+    misses: list[tuple[Path, tuple[str, int, int] | None, str | None]] = []
+    for filepath in filepaths:
+        key = yaml_cache_key(filepath) if cache_dir is not None else None
+        if cache_dir is not None and key is not None:
+            hit, data = read_yaml_cache(cache_dir / f"{filepath.name}.pickle", key)
+            if hit:
+                results[filepath] = (data, [])
+                continue
+        digest = None
+        if json_sidecar:
+            try:
+                digest = hashlib.sha256(filepath.read_bytes()).hexdigest()
+            except OSError:
+                pass
+            else:
+                hit, data = read_json_sidecar(filepath, digest)
+                if hit:
+                    results[filepath] = (data, [])
+                    continue
+        misses.append((filepath, key, digest))
+
+    parsed = parse_yaml_files([filepath for filepath, _, _ in misses])
+    for (filepath, key, digest), (data, errors) in zip(misses, parsed):
+        results[filepath] = (data, errors)
+        if errors:
+            continue
+        if cache_dir is not None and key is not None:
+            write_yaml_cache(cache_dir / f"{filepath.name}.pickle", key, data)
+        if digest is not None:
+            write_json_sidecar(filepath, digest, data)
+
+    return [results[filepath] for filepath in filepaths]
+
+
+def parse_yaml_files(filepaths: list[Path]) -> list[tuple[Any, list[Message]]]:
+    """Parse several YAML files, returning (data, errors) for each.
+
+    Files are joined into one multi-document stream, each after a
+    ``--- # file: <name>`` marker, and parsed with a single load_all call.
+    Files with their own document markers, directives or a byte order mark
+    can't be joined and are parsed on their own. When the stream fails,
+    only the file being parsed at that point is re-parsed alone, so its
+    error names it, and the stream resumes with the next file.
+    """
+    results: dict[int, tuple[Any, list[Message]]] = {}
+    batch: list[tuple[int, bytes]] = []
+    for i, filepath in enumerate(filepaths):
+        try:
+            raw = filepath.read_bytes()
+        except OSError:
+            raw = None
+        if raw is None or raw.startswith(UNICODE_BOMS) or DOC_MARKER_RE.search(raw):
+            errors: list[Message] = []
+            results[i] = (load_yaml_file(filepath, errors), errors)
+        else:
+            batch.append((i, raw))
+
+    while batch:
+        stream = b"".join(
+            b"--- # file: %s\n%s\n" % (filepaths[i].name.encode(), raw)
+            for i, raw in batch
+        )
+        parsed = 0
+        try:
+            for data in yaml.load_all(stream, Loader=YAML_LOADER):
+                # Each injected marker starts exactly one document
+                results[batch[parsed][0]] = (data, [])
+                parsed += 1
+        except Exception:
+            if parsed == len(batch):
+                break
+            i = batch[parsed][0]
+            errors = []
+            results[i] = (load_yaml_file(filepaths[i], errors), errors)
+            parsed += 1
+        batch = batch[parsed:]
+
+    return [results[i] for i in range(len(filepaths))]
+
+
+def peek_model(filepath: Path) -> str | None:
+    """Read the model ID from the file header without parsing the YAML.
+
+    Returns None if the header could not be read or has no ``model:`` key.
+    """
+    try:
+        with open(filepath, "rb") as f:
+            head = f.read(MODEL_HEADER_BYTES)
+    except OSError:
+        return None
+    match = MODEL_HEADER_RE.search(head)
+    return match.group(1).decode() if match else None
+
+
+def load_style_files(style_dir: Path) -> frozenset[str]:
+    """Return the names of all files in the style directory."""
+    try:
+        with os.scandir(style_dir) as entries:
+            return frozenset(e.name for e in entries if e.is_file())
+    except OSError:
+        return frozenset()
 
 
 def validate_layer(
     layer: dict[str, Any],
-    model: str,
-    style_dir: Path,
-    errors: list[str],
-    warnings: list[str],
+    expected_prefix: str,
+    style_files: frozenset[str],
+    errors: list[Message],
+    warnings: list[Message],
 ) -> str | None:
-    """Validate a single layer configuration. Returns layer ID if valid."""
-    layer_id = layer.get("id", "<missing>")
-
-    # Check required fields
-    for field in REQUIRED_LAYER_FIELDS:
-        if field not in layer:
-            errors.append(f"Layer '{layer_id}': missing required field '{field}'")
+    """Validate a single layer configuration. Returns layer ID if valid.
+
+    ``expected_prefix`` is the ``{model}_`` prefix layer IDs should carry.
+    """
+    # Read each field once up front
+    get = layer.get
+    layer_id = get("id", "<missing>")
+    is_composite = get("composite", False)
+    units = get("units", {})
+    style_file = get("style_file")
+    levels = get("levels", [])
+    requires = get("requires")
+
+    # Check required fields (report in declaration order for stable output)
+    missing = _REQUIRED_LAYER_FIELDS_SET.difference(layer)
+    if missing:
+        for field in REQUIRED_LAYER_FIELDS:
+            if field in missing:
+                errors.append(
+                    ("Layer '%s': missing required field '%s'", (layer_id, field))
+                )
 
     # Check units.native (not required for composite layers)
-    is_composite = layer.get("composite", False)
-    units = layer.get("units", {})
-    if units and not isinstance(units, dict):
-        errors.append(f"Layer '{layer_id}': 'units' must be an object")
+    if units and type(units) is not dict:
+        errors.append(("Layer '%s': 'units' must be an object", (layer_id,)))
     elif not is_composite:
         if not units:
-            errors.append(f"Layer '{layer_id}': missing required field 'units'")
+            errors.append(("Layer '%s': missing required field 'units'", (layer_id,)))
         elif "native" not in units:
-            errors.append(f"Layer '{layer_id}': missing required field 'units.native'")
+            errors.append(
+                ("Layer '%s': missing required field 'units.native'", (layer_id,))
+            )
 
     # Check layer ID naming convention
-    if "id" in layer and "parameter" in layer:
-        expected_prefix = f"{model}_"
+    if "id" not in missing and "parameter" not in missing:
         if not layer_id.startswith(expected_prefix):
             warnings.append(
-                f"Layer '{layer_id}': ID should start with '{expected_prefix}'"
+                ("Layer '%s': ID should start with '%s'", (layer_id, expected_prefix))
             )
 
     # Check style file exists
-    style_file = layer.get("style_file")
-    if style_file:
-        style_path = style_dir / style_file
-        if not style_path.exists():
-            errors.append(
-                f"Layer '{layer_id}': style file '{style_file}' not found in config/styles/"
+    if style_file and style_file not in style_files:
+        errors.append(
+            (
+                "Layer '%s': style file '%s' not found in config/styles/",
+                (layer_id, style_file),
             )
+        )
 
     # Check levels have a default
-    levels = layer.get("levels", [])
     if levels:
-        has_default = any(
-            isinstance(lv, dict) and lv.get("default", False) for lv in levels
-        )
+        has_default = False
+        for lv in levels:
+            if type(lv) is dict and lv.get("default"):
+                has_default = True
+                break
         if not has_default:
-            warnings.append(f"Layer '{layer_id}': no default level specified")
+            warnings.append(("Layer '%s': no default level specified", (layer_id,)))
 
     # Check composite layers have requires field
-    if layer.get("composite") and not layer.get("requires"):
-        errors.append(f"Layer '{layer_id}': composite layer must have 'requires' field")
+    if is_composite and not requires:
+        errors.append(
+            ("Layer '%s': composite layer must have 'requires' field", (layer_id,))
+        )
 
-    return layer_id if "id" in layer else None
+    return layer_id if "id" not in missing else None
+
+
+def validate_files(
+    filepaths: list[Path],
+    style_files: frozenset[str],
+    cache_dir: Path | None = None,
+    json_sidecar: bool = False,
+) -> list[tuple[list[Message], list[Message], list[str], int]]:
+    """Parse and validate a batch of layer config files, in order.
+
+    Files larger than STREAMING_THRESHOLD_BYTES are validated from the YAML
+    event stream instead of being loaded whole.
+    """
+    large = set()
+    for filepath in filepaths:
+        try:
+            if filepath.stat().st_size > STREAMING_THRESHOLD_BYTES:
+                large.add(filepath)
+        except OSError:
+            pass
+
+    small = [f for f in filepaths if f not in large]
+    loaded = dict(zip(small, load_yaml_files(small, cache_dir, json_sidecar)))
+
+    results = []
+    for filepath in filepaths:
+        if filepath in large:
+            results.append(validate_file_streaming(filepath, style_files))
+        else:
+            data, errors = loaded[filepath]
+            results.append(validate_file(filepath, data, errors, style_files))
+    return results
+
+
+def validate_layer_entry(
+    layer: Any,
+    expected_prefix: str,
+    style_files: frozenset[str],
+    errors: list[Message],
+    warnings: list[Message],
+    layer_ids: list[str],
+) -> None:
+    """Validate one entry of a file's ``layers`` list, recording its ID."""
+    if type(layer) is not dict:
+        errors.append(
+            ("Layer entry must be an object, got: %s", (type(layer).__name__,))
+        )
+        return
 
+    layer_id = validate_layer(layer, expected_prefix, style_files, errors, warnings)
+    if layer_id:
+        layer_ids.append(layer_id)
 
-def validate_file(
-    filepath: Path, style_dir: Path, all_layer_ids: dict[str, str]
-) -> tuple[int, int]:
-    """Validate a single layer config file. Returns (error_count, warning_count)."""
-    errors: list[str] = []
-    warnings: list[str] = []
 
-    print(f"\nValidating {filepath.name}...")
+def check_model_fields(data: Any, errors: list[Message]) -> None:
+    """Check the required top-level fields of a layer config file."""
+    missing = _REQUIRED_MODEL_FIELDS_SET.difference(data)
+    if missing:
+        for field in REQUIRED_MODEL_FIELDS:
+            if field in missing:
+                errors.append(("Missing required field '%s'", (field,)))
+
+
+def validate_file(
+    filepath: Path, data: Any, errors: list[Message], style_files: frozenset[str]
+) -> tuple[list[Message], list[Message], list[str], int]:
+    """Validate the parsed contents of a single layer config file.
+
+    ``errors`` holds any errors already raised while loading the file.
+    May run in a worker process, so it stays a top-level function with
+    picklable arguments and results and touches no shared state. Returns
+    (errors, warnings, layer_ids, layer_count); duplicate IDs across files
+    are detected by the caller from the returned layer IDs.
+    """
+    warnings: list[Message] = []
+    layer_ids: list[str] = []
 
-    data = load_yaml_file(filepath)
     if data is None:
-        return 1, 0
+        if not errors:
+            errors.append(("%s is empty", (filepath.name,)))
+        return errors, warnings, layer_ids, 0
+    if not isinstance(data, dict):
+        errors.append(("%s must be a mapping", (filepath.name,)))
+        return errors, warnings, layer_ids, 0
 
     # Check required model fields
-    for field in REQUIRED_MODEL_FIELDS:
-        if field not in data:
-            errors.append(f"Missing required field '{field}'")
+    check_model_fields(data, errors)
 
     model = data.get("model", "unknown")
     layers = data.get("layers", [])
 
     if not isinstance(layers, list):
-        errors.append("'layers' must be a list")
+        errors.append(("'layers' must be a list", ()))
         layers = []
 
     # Validate each layer
+    expected_prefix = f"{model}_"
     for layer in layers:
-        if not isinstance(layer, dict):
-            errors.append(f"Layer entry must be an object, got: {type(layer).__name__}")
-            continue
+        validate_layer_entry(
+            layer, expected_prefix, style_files, errors, warnings, layer_ids
+        )
 
-        layer_id = validate_layer(layer, model, style_dir, errors, warnings)
+    return errors, warnings, layer_ids, len(layers)
+
+
+class _StreamingUnsupported(Exception):
+    """The file's layout can't be validated from the event stream."""
+
+
+def compose_event_node(
+    events: Iterator[yaml.Event],
+    event: yaml.Event,
+    resolver: yaml.resolver.BaseResolver,
+    anchors: dict[str, yaml.Node],
+) -> yaml.Node:
+    """Build the node starting at ``event``, pulling the rest from ``events``."""
+    if isinstance(event, yaml.AliasEvent):
+        return anchors[event.anchor or ""]
+
+    node: yaml.Node
+    tag = getattr(event, "tag", None)
+    if tag == "!":
+        tag = None
+    if isinstance(event, yaml.ScalarEvent):
+        if tag is None:
+            tag = resolver.resolve(yaml.ScalarNode, event.value, event.implicit)
+        node = yaml.ScalarNode(tag, event.value, style=event.style)
+    elif isinstance(event, yaml.SequenceStartEvent):
+        if tag is None:
+            tag = resolver.resolve(yaml.SequenceNode, None, event.implicit)
+        node = yaml.SequenceNode(tag, [], flow_style=event.flow_style)
+        for child in events:
+            if isinstance(child, yaml.SequenceEndEvent):
+                break
+            node.value.append(compose_event_node(events, child, resolver, anchors))
+    elif isinstance(event, yaml.MappingStartEvent):
+        if tag is None:
+            tag = resolver.resolve(yaml.MappingNode, None, event.implicit)
+        node = yaml.MappingNode(tag, [], flow_style=event.flow_style)
+        for key_event in events:
+            if isinstance(key_event, yaml.MappingEndEvent):
+                break
+            key = compose_event_node(events, key_event, resolver, anchors)
+            value = compose_event_node(events, next(events), resolver, anchors)
+            node.value.append((key, value))
+    else:
+        raise yaml.YAMLError(f"unexpected event {event!r}")
 
-        if layer_id:
-            # Check for duplicate IDs
-            if layer_id in all_layer_ids:
-                errors.append(
-                    f"Duplicate layer ID '{layer_id}' (also in {all_layer_ids[layer_id]})"
-                )
-            else:
-                all_layer_ids[layer_id] = filepath.name
+    if event.anchor is not None:
+        anchors[event.anchor] = node
+    return node
+
+
+def validate_file_streaming(
+    filepath: Path, style_files: frozenset[str]
+) -> tuple[list[Message], list[Message], list[str], int]:
+    """Validate a layer config file from its YAML event stream.
+
+    Only one layer is held in memory at a time. Top-level fields other than
+    ``layers`` are loaded normally. Falls back to a full load if the file
+    isn't a single mapping or ``layers`` appears before ``model``.
+    """
+    errors: list[Message] = []
+    warnings: list[Message] = []
+    layer_ids: list[str] = []
+    header: dict[str, Any] = {}
+    layer_count = 0
 
-    # Print results for this file
+    resolver = yaml.resolver.Resolver()
+    constructor = yaml.constructor.SafeConstructor()
+    anchors: dict[str, yaml.Node] = {}
+
+    def construct(event: yaml.Event) -> Any:
+        node = compose_event_node(events, event, resolver, anchors)
+        return constructor.construct_document(node)
+
+    try:
+        with open(filepath, "rb") as f:
+            events = yaml.parse(f, Loader=YAML_LOADER)
+            kinds = [type(event) for event in islice(events, 3)]
+            if kinds != [
+                yaml.StreamStartEvent,
+                yaml.DocumentStartEvent,
+                yaml.MappingStartEvent,
+            ]:
+                raise _StreamingUnsupported
+
+            for key_event in events:
+                if isinstance(key_event, yaml.MappingEndEvent):
+                    break
+                key = construct(key_event)
+                value_event = next(events)
+                if key != "layers":
+                    header[key] = construct(value_event)
+                    continue
+
+                if "model" not in header:
+                    raise _StreamingUnsupported
+                header[key] = None
+                if not isinstance(value_event, yaml.SequenceStartEvent):
+                    construct(value_event)
+                    errors.append(("'layers' must be a list", ()))
+                    continue
+
+                expected_prefix = f"{header['model']}_"
+                for item_event in events:
+                    if isinstance(item_event, yaml.SequenceEndEvent):
+                        break
+                    layer_count += 1
+                    validate_layer_entry(
+                        construct(item_event),
+                        expected_prefix,
+                        style_files,
+                        errors,
+                        warnings,
+                        layer_ids,
+                    )
+
+            # Multi-document files go through the regular loader's error path
+            if not isinstance(next(events, None), yaml.DocumentEndEvent):
+                raise _StreamingUnsupported
+            if not isinstance(next(events, None), yaml.StreamEndEvent):
+                raise _StreamingUnsupported
+    except _StreamingUnsupported:
+        load_errors: list[Message] = []
+        data = load_yaml_file(filepath, load_errors)
+        return validate_file(filepath, data, load_errors, style_files)
+    except yaml.YAMLError as e:
+        return [yaml_syntax_error(filepath, e)], [], [], 0
+    except Exception as e:
+        return [("Could not read %s: %s", (filepath.name, str(e)))], [], [], 0
+
+    # Report missing model fields ahead of per-layer errors, as validate_file does
+    header_errors: list[Message] = []
+    check_model_fields(header, header_errors)
+    return header_errors + errors, warnings, layer_ids, layer_count
+
+
+def print_file_report(
+    filepath: Path, errors: list[Message], warnings: list[Message], layer_count: int
+) -> None:
+    """Print the validation results for one file."""
+    print(f"\nValidating {filepath.name}...")
     if errors:
-        for err in errors:
-            print(f"  ERROR: {err}")
+        for tmpl, args in errors:
+            print(f"  ERROR: {tmpl % args}")
     if warnings:
-        for warn in warnings:
-            print(f"  WARNING: {warn}")
+        for tmpl, args in warnings:
+            print(f"  WARNING: {tmpl % args}")
     if not errors and not warnings:
-        print(f"  OK ({len(layers)} layers)")
+        print(f"  OK ({layer_count} layers)")
+
+
+def main() -> None:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Validate WMS layer configuration files")
+    parser.add_argument(
+        "--model",
+        action="append",
+        help="Only validate files for this model (may be repeated)",
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help=f"Reuse parsed YAML for unchanged files (stored in {CACHE_DIR_NAME}/)",
+    )
+    parser.add_argument(
+        "--json-sidecar",
+        action="store_true",
+        help="Load each file from a .json copy rendered from the same YAML, "
+        "writing one when it is missing or stale",
+    )
+    args = parser.parse_args()
 
-    return len(errors), len(warnings)
-
-
-def main():
     # Determine paths
     script_dir = Path(__file__).parent
     style_dir = script_dir.parent / "styles"
 
     # Find all layer YAML files (exclude README)
-    layer_files = sorted(script_dir.glob("*.yaml"))
+    with os.scandir(script_dir) as entries:
+        layer_files = [
+            Path(path)
+            for path in sorted(
+                e.path for e in entries if e.name.endswith(".yaml") and e.is_file()
+            )
+        ]
 
     if not layer_files:
         print("ERROR: No .yaml files found in config/layers/")
         sys.exit(1)
 
+    # Skip files for other models before paying for a full parse. Files whose
+    # header can't be read are kept and fully validated.
+    if args.model:
+        wanted = {None, *args.model}
+        layer_files = [f for f in layer_files if peek_model(f) in wanted]
+        if not layer_files:
+            print(f"ERROR: No layer files found for model(s): {', '.join(args.model)}")
+            sys.exit(1)
+
     print(f"Layer Configuration Validator")
     print(f"=" * 50)
     print(f"Found {len(layer_files)} layer config file(s)")
     print(f"Style directory: {style_dir}")
 
+    # List the style directory once rather than stat'ing per layer
+    style_files = load_style_files(style_dir)
+
+    cache_dir = None
+    if args.cache:
+        cache_dir = script_dir / CACHE_DIR_NAME
+        cache_dir.mkdir(exist_ok=True)
+
     # Track all layer IDs across files
     all_layer_ids: dict[str, str] = {}
     total_errors = 0
     total_warnings = 0
 
-    for filepath in layer_files:
-        errors, warnings = validate_file(filepath, style_dir, all_layer_ids)
-        total_errors += errors
-        total_warnings += warnings
+    # Files are independent, so once there are enough of them split them into
+    # contiguous batches and validate the batches in parallel. Results are
+    # merged in filename order to keep the output deterministic.
+    batches = [layer_files]
+    if len(layer_files) >= PARALLEL_MIN_FILES:
+        workers = min(len(layer_files), os.cpu_count() or 1)
+        batch_size = -(-len(layer_files) // workers)
+        batches = [
+            layer_files[i : i + batch_size]
+            for i in range(0, len(layer_files), batch_size)
+        ]
+    if len(batches) > 1:
+        with ProcessPoolExecutor(max_workers=len(batches)) as executor:
+            batch_results = executor.map(
+                validate_files,
+                batches,
+                repeat(style_files),
+                repeat(cache_dir),
+                repeat(args.json_sidecar),
+            )
+            results = [r for batch in batch_results for r in batch]
+    else:
+        results = validate_files(
+            layer_files, style_files, cache_dir, args.json_sidecar
+        )
+
+    for filepath, (errors, warnings, layer_ids, layer_count) in zip(
+        layer_files, results
+    ):
+        # Check for duplicate IDs, both across files and within this one
+        seen_this_file: set[str] = set()
+        for layer_id in layer_ids:
+            prior = all_layer_ids.setdefault(layer_id, filepath.name)
+            if prior != filepath.name or layer_id in seen_this_file:
+                errors.append(
+                    ("Duplicate layer ID '%s' (also in %s)", (layer_id, prior))
+                )
+            seen_this_file.add(layer_id)
+
+        print_file_report(filepath, errors, warnings, layer_count)
+        total_errors += len(errors)
+        total_warnings += len(warnings)
 
     # Summary
     print(f"\n{'=' * 50}")
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Tests for validate.py.
+
+Usage:
+    python -m unittest test_validate     # from config/models/
+"""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+import yaml
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from validate import ModelValidator  # noqa: E402
+
+MODEL_DIR = Path(__file__).parent
+
+# Every section but parameters and composites is taken from hrrr.yaml, so
+# all reported problems come from these entries
+MALFORMED_PARAMETERS = [
+    {"levels": [{"type": "surface"}], "style": "bogus"},
+    {"name": 5, "levels": [], "conversion": "bogus"},
+    {"name": "TMP", "levels": [{"values": []}, {"type": "bogus", "values": 3}]},
+    "PRES",
+]
+MALFORMED_COMPOSITES = [
+    {"requires": "TMP"},
+    {"requires": ["TMP", 5]},
+    {"name": "wind"},
+]
+
+
+def validate_text(text: str) -> ModelValidator:
+    with tempfile.TemporaryDirectory() as tmp:
+        filepath = Path(tmp) / "malformed.yaml"
+        filepath.write_text(text)
+        validator = ModelValidator(str(filepath))
+        validator.validate()
+    return validator
+
+
+def messages(errors) -> list[tuple[str, str]]:
+    return [(e.path, e.message) for e in errors or ()]
+
+
+class MalformedModelTest(unittest.TestCase):
+    """A bad entry must not hide problems with its other fields."""
+
+    def test_repo_model_files(self):
+        for filepath in sorted(MODEL_DIR.glob("*.yaml")):
+            with self.subTest(file=filepath.name):
+                self.assertTrue(ModelValidator(str(filepath)).validate())
+
+    def test_malformed_parameters_and_composites(self):
+        data = yaml.safe_load((MODEL_DIR / "hrrr.yaml").read_text())
+        data["parameters"] = MALFORMED_PARAMETERS
+        data["composites"] = MALFORMED_COMPOSITES
+        validator = validate_text(yaml.safe_dump(data))
+
+        self.assertEqual(
+            messages(validator.errors),
+            [
+                ("parameters[0].name", "Missing required field 'name'"),
+                ("parameters[1].name", "Must be a string"),
+                ("parameters[1].levels", "Must have at least one level defined"),
+                ("parameters[2].levels[0].type", "Missing required field 'type'"),
+                ("parameters[2].levels[0].values", "Must have at least one value"),
+                ("parameters[2].levels[1].values", "Must be a list"),
+                ("parameters[3]", "Each parameter must be a mapping"),
+                ("composites[0].name", "Missing required field 'name'"),
+                ("composites[0].requires", "Must be a list of parameter names"),
+                ("composites[1].name", "Missing required field 'name'"),
+                ("composites[2].requires", "Missing required field 'requires'"),
+            ],
+        )
+        self.assertEqual(
+            [path for path, _ in messages(validator.warnings)],
+            [
+                "parameters[0].style",
+                "parameters[1].conversion",
+                "parameters[2].levels[1].type",
+                "composites[1].requires",
+            ],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
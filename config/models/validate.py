@@ -9,6 +9,7 @@ Usage:
     ./validate.py                    # Validate all *.yaml files in current directory
     ./validate.py gfs.yaml           # Validate specific file
     ./validate.py *.yaml             # Validate multiple files
+    ./validate.py --no-cache         # Re-parse every file, ignoring the cache
     ./validate.py --help             # Show help
 
 Exit codes:
@@ -19,9 +20,14 @@ Exit codes:
 
 import sys
 import os
+import hashlib
+import pickle
 import re
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import repeat
 from pathlib import Path
-from typing import Any
+from typing import Any, Sequence
 
 # Try to import yaml, with helpful error if not installed
 try:
@@ -30,80 +36,191 @@ except ImportError:
     print("ERROR: PyYAML is required. Install with: pip install pyyaml")
     sys.exit(1)
 
+# Prefer the libyaml-backed loader. Without libyaml, use ruamel.yaml's safe
+# loader if it is installed, and only then PyYAML's pure-Python loader.
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+YAML_ERRORS: tuple[type[Exception], ...] = (yaml.YAMLError,)
+_RUAMEL_YAML = None
+if YAML_LOADER is yaml.SafeLoader:
+    try:
+        import ruamel.yaml
+
+        _RUAMEL_YAML = ruamel.yaml.YAML(typ="safe", pure=False)
+        # ruamel defaults to YAML 1.2; match PyYAML's 1.1 scalars (yes/no/on/off)
+        _RUAMEL_YAML.version = (1, 1)
+        YAML_ERRORS += (ruamel.yaml.YAMLError,)
+    except ImportError:
+        pass
+
+
+class RootNotMappingError(Exception):
+    """The YAML document's root is not a mapping."""
+
+
+class MappingRootLoader(YAML_LOADER):
+    """Loader that rejects non-mapping roots before building any objects."""
+
+    def get_single_node(self):
+        node = super().get_single_node()
+        if not isinstance(node, yaml.MappingNode):
+            raise RootNotMappingError
+        return node
+
+
+def load_yaml(stream: Any) -> dict:
+    """Parse a YAML mapping with the fastest available safe loader.
+
+    Raises RootNotMappingError if the document root is not a mapping.
+    """
+    if _RUAMEL_YAML is None:
+        return yaml.load(stream, Loader=MappingRootLoader)
+    data = _RUAMEL_YAML.load(stream)
+    if not isinstance(data, dict):
+        raise RootNotMappingError
+    return data
+
 
 # =============================================================================
 # Schema Definition
 # =============================================================================
 
 # Valid values for enumerated fields
-VALID_DIMENSION_TYPES = {"forecast", "observation"}
-VALID_SOURCE_TYPES = {"aws_s3", "aws_s3_goes", "aws_s3_grib2", "local", "http"}
-VALID_PROJECTION_TYPES = {
-    "geographic",
-    "latlon",
-    "geostationary",
-    "lambert_conformal",
-    "mercator",
-}
-VALID_SCHEDULE_TYPES = {"forecast", "observation"}
-VALID_LEVEL_TYPES = {
-    "surface",
-    "height_above_ground",
-    "height_above_ground_layer",  # For layer-averaged data (e.g., 0-6km)
-    "height_above_msl",  # For radar data at height above mean sea level
-    "isobaric",
-    "mean_sea_level",
-    "entire_atmosphere",
-    "low_cloud_layer",
-    "middle_cloud_layer",
-    "high_cloud_layer",
-    "cloud_top",
-    "top_of_atmosphere",
-    "depth_below_surface",
-    "boundary_layer",
-    "tropopause",
+VALID_DIMENSION_TYPES = frozenset({"forecast", "observation"})
+VALID_SOURCE_TYPES = frozenset(
+    {"aws_s3", "aws_s3_goes", "aws_s3_grib2", "local", "http"}
+)
+VALID_PROJECTION_TYPES = frozenset(
+    {
+        "geographic",
+        "latlon",
+        "geostationary",
+        "lambert_conformal",
+        "mercator",
+    }
+)
+VALID_SCHEDULE_TYPES = frozenset({"forecast", "observation"})
+VALID_LEVEL_TYPES = frozenset(
+    {
+        "surface",
+        "height_above_ground",
+        "height_above_ground_layer",  # For layer-averaged data (e.g., 0-6km)
+        "height_above_msl",  # For radar data at height above mean sea level
+        "isobaric",
+        "mean_sea_level",
+        "entire_atmosphere",
+        "low_cloud_layer",
+        "middle_cloud_layer",
+        "high_cloud_layer",
+        "cloud_top",
+        "top_of_atmosphere",
+        "depth_below_surface",
+        "boundary_layer",
+        "tropopause",
+    }
+)
+VALID_STYLES = frozenset(
+    {
+        "default",
+        "temperature",
+        "wind",
+        "precipitation",
+        "humidity",
+        "atmospheric",
+        "cape",
+        "cloud",
+        "visibility",
+        "reflectivity",
+        "precip_rate",
+        "goes_visible",
+        "goes_ir",
+        "wind_barbs",
+        "helicity",
+        "lightning",
+        "smoke",
+        "radar",
+        "geopotential",
+    }
+)
+VALID_CONVERSIONS = frozenset(
+    {
+        "K_to_C",
+        "K_to_F",
+        "Pa_to_hPa",
+        "Pa_to_mb",
+        "m_to_km",
+        "m_to_ft",
+        "m_to_kft",  # meters to kilofeet (for cloud tops)
+        "ms_to_kt",
+        "ms_to_mph",
+    }
+)
+
+
+# Pre-joined lists of valid values for error messages
+_VALID_CONVERSIONS_STR = ", ".join(sorted(VALID_CONVERSIONS))
+_VALID_DIMENSION_TYPES_STR = ", ".join(sorted(VALID_DIMENSION_TYPES))
+_VALID_LEVEL_TYPES_STR = ", ".join(sorted(VALID_LEVEL_TYPES))
+_VALID_PROJECTION_TYPES_STR = ", ".join(sorted(VALID_PROJECTION_TYPES))
+_VALID_SOURCE_TYPES_STR = ", ".join(sorted(VALID_SOURCE_TYPES))
+_VALID_STYLES_STR = ", ".join(sorted(VALID_STYLES))
+
+# Key pairs that must both be present before a bbox range can be compared
+_BBOX_LON_PAIR = frozenset({"min_lon", "max_lon"})
+_BBOX_LAT_PAIR = frozenset({"min_lat", "max_lat"})
+
+# Precompiled patterns for string fields
+_MODEL_ID_RE = re.compile(r"^[a-z][a-z0-9_]*$")
+
+# Simple per-field checks, applied by ModelValidator._check_fields:
+# (field, expected type, required, pattern, pattern description)
+FieldRule = tuple[str, type, bool, re.Pattern | None, str | None]
+
+_TYPE_MESSAGES = {
+    str: "Must be a string",
+    bool: "Must be a boolean (true/false)",
 }
-VALID_STYLES = {
-    "default",
-    "temperature",
-    "wind",
-    "precipitation",
-    "humidity",
-    "atmospheric",
-    "cape",
-    "cloud",
-    "visibility",
-    "reflectivity",
-    "precip_rate",
-    "goes_visible",
-    "goes_ir",
-    "wind_barbs",
-    "helicity",
-    "lightning",
-    "smoke",
-    "radar",
-    "geopotential",
-}
-VALID_CONVERSIONS = {
-    "K_to_C",
-    "K_to_F",
-    "Pa_to_hPa",
-    "Pa_to_mb",
-    "m_to_km",
-    "m_to_ft",
-    "m_to_kft",  # meters to kilofeet (for cloud tops)
-    "ms_to_kt",
-    "ms_to_mph",
-}
-
 
+_MODEL_FIELDS: tuple[FieldRule, ...] = (
+    (
+        "id",
+        str,
+        True,
+        _MODEL_ID_RE,
+        "Must be lowercase alphanumeric with underscores, starting with letter",
+    ),
+    ("name", str, True, None, None),
+    ("description", str, False, None, None),
+    ("enabled", bool, False, None, None),
+)
+_DIMENSION_FIELDS: tuple[FieldRule, ...] = (
+    ("run", bool, False, None, None),
+    ("forecast", bool, False, None, None),
+    ("time", bool, False, None, None),
+    ("elevation", bool, False, None, None),
+)
+_DIMENSION_FLAGS = frozenset(rule[0] for rule in _DIMENSION_FIELDS)
+_RUN_FORECAST_FLAGS = frozenset({"run", "forecast"})
+_PRECACHING_FIELDS: tuple[FieldRule, ...] = (("enabled", bool, False, None, None),)
+_PARAMETER_FIELDS: tuple[FieldRule, ...] = (
+    ("description", str, False, None, None),
+    ("units", str, False, None, None),
+    ("display_units", str, False, None, None),
+)
+
+# Parsed YAML is cached here unless --no-cache is given
+CACHE_DIR_NAME = ".validate_cache"
+
+# Use a process pool once there are enough files to amortize its startup
+PARALLEL_MIN_FILES = 4
+
+
+@dataclass(frozen=True, slots=True)
 class ValidationError:
     """Represents a single validation error."""
 
-    def __init__(self, path: str, message: str, severity: str = "error"):
-        self.path = path
-        self.message = message
-        self.severity = severity  # "error" or "warning"
+    path: str
+    message: str
+    severity: str = "error"  # "error" or "warning"
 
     def __str__(self):
         icon = "ERROR" if self.severity == "error" else "WARNING"
@@ -113,81 +230,107 @@ class ValidationError:
 class ModelValidator:
     """Validates model configuration YAML files."""
 
-    def __init__(self, filename: str):
+    def __init__(self, filename: str, cache_dir: Path | None = None):
         self.filename = filename
-        self.errors: list[ValidationError] = []
-        self.warnings: list[ValidationError] = []
+        self.cache_dir = cache_dir
+        # Allocated on first use; most files produce no errors or warnings
+        self.errors: list[ValidationError] | None = None
+        self.warnings: list[ValidationError] | None = None
+        self._seen: set[ValidationError] | None = None
+        # Filled in by the parameters pass for the composites cross-reference
+        self._defined_param_names: set = set()
         self.data: dict = {}
 
+    def _load(self) -> dict:
+        """Parse the file, reusing the cached parse if it hasn't changed."""
+        if self.cache_dir is None:
+            with open(self.filename, "r") as f:
+                return load_yaml(f)
+
+        st = os.stat(self.filename)
+        stamp = (st.st_mtime_ns, st.st_size)
+        key = hashlib.blake2b(
+            os.path.abspath(self.filename).encode(), digest_size=16
+        ).hexdigest()
+        cache_file = self.cache_dir / f"{key}.pickle"
+        try:
+            with open(cache_file, "rb") as f:
+                cached = pickle.load(f)
+            if cached["stamp"] == stamp:
+                return cached["data"]
+        except Exception:
+            pass  # Missing or unreadable cache entry; parse the file
+
+        with open(self.filename, "r") as f:
+            data = load_yaml(f)
+        try:
+            with open(cache_file, "wb") as f:
+                pickle.dump({"stamp": stamp, "data": data}, f)
+        except OSError:
+            pass
+        return data
+
     def add_error(self, path: str, message: str):
-        self.errors.append(ValidationError(path, message, "error"))
+        if self.errors is None:
+            self.errors = []
+        self._add(self.errors, ValidationError(path, message, "error"))
 
     def add_warning(self, path: str, message: str):
-        self.warnings.append(ValidationError(path, message, "warning"))
+        if self.warnings is None:
+            self.warnings = []
+        self._add(self.warnings, ValidationError(path, message, "warning"))
+
+    def _add(self, target: list[ValidationError], error: ValidationError):
+        """Record an error or warning unless an identical one already exists."""
+        if self._seen is None:
+            self._seen = set()
+        if error not in self._seen:
+            self._seen.add(error)
+            target.append(error)
 
     def validate(self) -> bool:
         """Validate the YAML file. Returns True if valid (no errors)."""
         # Load YAML
         try:
-            with open(self.filename, "r") as f:
-                self.data = yaml.safe_load(f)
-        except yaml.YAMLError as e:
+            self.data = self._load()
+        except YAML_ERRORS as e:
             self.add_error("(file)", f"Invalid YAML syntax: {e}")
             return False
         except FileNotFoundError:
             self.add_error("(file)", f"File not found: {self.filename}")
             return False
-
-        if not isinstance(self.data, dict):
+        except RootNotMappingError:
             self.add_error("(root)", "Root must be a YAML mapping/dictionary")
             return False
 
-        # Validate each section
-        self._validate_model_section()
-        self._validate_dimensions_section()
-        self._validate_source_section()
-        self._validate_grid_section()
-        self._validate_schedule_section()
-        self._validate_retention_section()
-        self._validate_precaching_section()
-        self._validate_parameters_section()
-        self._validate_composites_section()
+        # Report all missing sections up front, then validate those present
+        missing = _SECTION_NAMES - self.data.keys()
+        if missing:
+            for section, severity, message, _ in _SECTION_SPECS:
+                if section not in missing or severity is None:
+                    continue
+                if severity == "error":
+                    self.add_error(section, message)
+                else:
+                    self.add_warning(section, message)
+
+        for section, _, _, validator in _SECTION_SPECS:
+            if section not in missing:
+                validator(self)
 
-        return len(self.errors) == 0
+        return not self.errors
 
     def _validate_model_section(self):
         """Validate the 'model' section (required)."""
-        if "model" not in self.data:
-            self.add_error("model", "Missing required section 'model'")
-            return
-
         model = self.data["model"]
         if not isinstance(model, dict):
             self.add_error("model", "Section must be a mapping")
             return
 
-        # Required fields
-        self._require_string(
-            model,
-            "model.id",
-            r"^[a-z][a-z0-9_]*$",
-            "Must be lowercase alphanumeric with underscores, starting with letter",
-        )
-        self._require_string(model, "model.name")
-
-        # Optional fields
-        self._optional_string(model, "model.description")
-        self._optional_bool(model, "model.enabled")
+        self._check_fields(model, "model", _MODEL_FIELDS)
 
     def _validate_dimensions_section(self):
         """Validate the 'dimensions' section (recommended)."""
-        if "dimensions" not in self.data:
-            self.add_warning(
-                "dimensions",
-                "Missing 'dimensions' section - will infer from schedule.type",
-            )
-            return
-
         dims = self.data["dimensions"]
         if not isinstance(dims, dict):
             self.add_error("dimensions", "Section must be a mapping")
@@ -202,36 +345,20 @@ class ModelValidator:
         elif dim_type not in VALID_DIMENSION_TYPES:
             self.add_error(
                 "dimensions.type",
-                f"Invalid type '{dim_type}'. Must be one of: {', '.join(sorted(VALID_DIMENSION_TYPES))}",
+                f"Invalid type '{dim_type}'. Must be one of: {_VALID_DIMENSION_TYPES_STR}",
             )
 
         # Type-specific validation
-        if dim_type == "forecast":
-            # Forecast models should have run and forecast dimensions
-            if dims.get("time"):
-                self.add_warning(
-                    "dimensions.time",
-                    "Forecast models typically don't use TIME dimension (use RUN + FORECAST)",
-                )
-        elif dim_type == "observation":
-            # Observation models should have time dimension
-            if dims.get("run") or dims.get("forecast"):
-                self.add_warning(
-                    "dimensions.run/forecast",
-                    "Observation models typically don't use RUN/FORECAST dimensions (use TIME)",
-                )
+        check = _DIMENSION_TYPE_CHECKS.get(dim_type)
+        if check:
+            check(self, dims)
 
         # All dimension flags should be boolean
-        for field in ["run", "forecast", "time", "elevation"]:
-            if field in dims and not isinstance(dims[field], bool):
-                self.add_error(f"dimensions.{field}", f"Must be a boolean (true/false)")
+        if not _DIMENSION_FLAGS.isdisjoint(dims):
+            self._check_fields(dims, "dimensions", _DIMENSION_FIELDS)
 
     def _validate_source_section(self):
         """Validate the 'source' section (required)."""
-        if "source" not in self.data:
-            self.add_error("source", "Missing required section 'source'")
-            return
-
         source = self.data["source"]
         if not isinstance(source, dict):
             self.add_error("source", "Section must be a mapping")
@@ -244,26 +371,16 @@ class ModelValidator:
         elif source_type not in VALID_SOURCE_TYPES:
             self.add_error(
                 "source.type",
-                f"Invalid type '{source_type}'. Must be one of: {', '.join(sorted(VALID_SOURCE_TYPES))}",
+                f"Invalid type '{source_type}'. Must be one of: {_VALID_SOURCE_TYPES_STR}",
             )
 
-        # AWS S3 sources need bucket
-        if source_type and source_type.startswith("aws_s3"):
-            if "bucket" not in source:
-                self.add_error(
-                    "source.bucket", "Missing required field 'bucket' for AWS S3 source"
-                )
-            if "region" not in source:
-                self.add_warning(
-                    "source.region", "Missing 'region' - will default to us-east-1"
-                )
+        # Type-specific validation
+        check = _SOURCE_TYPE_CHECKS.get(source_type)
+        if check:
+            check(self, source)
 
     def _validate_grid_section(self):
         """Validate the 'grid' section (required)."""
-        if "grid" not in self.data:
-            self.add_error("grid", "Missing required section 'grid'")
-            return
-
         grid = self.data["grid"]
         if not isinstance(grid, dict):
             self.add_error("grid", "Section must be a mapping")
@@ -276,7 +393,7 @@ class ModelValidator:
         elif projection not in VALID_PROJECTION_TYPES:
             self.add_error(
                 "grid.projection",
-                f"Invalid projection '{projection}'. Must be one of: {', '.join(sorted(VALID_PROJECTION_TYPES))}",
+                f"Invalid projection '{projection}'. Must be one of: {_VALID_PROJECTION_TYPES_STR}",
             )
 
         # Validate bbox if present
@@ -297,15 +414,48 @@ class ModelValidator:
                         self.add_error(f"grid.bbox.{field}", "Must be a number")
 
                 # Validate ranges
-                if all(f in bbox for f in ["min_lon", "max_lon"]):
+                if _BBOX_LON_PAIR <= bbox.keys():
                     if bbox["min_lon"] >= bbox["max_lon"]:
                         self.add_error("grid.bbox", "min_lon must be less than max_lon")
-                if all(f in bbox for f in ["min_lat", "max_lat"]):
+                if _BBOX_LAT_PAIR <= bbox.keys():
                     if bbox["min_lat"] >= bbox["max_lat"]:
                         self.add_error("grid.bbox", "min_lat must be less than max_lat")
 
-        # Geostationary projection needs projection_params
-        if projection == "geostationary" and "projection_params" not in grid:
+        # Projection-specific validation
+        check = _PROJECTION_CHECKS.get(projection)
+        if check:
+            check(self, grid)
+
+    def _check_forecast_dimensions(self, dims: dict):
+        """Forecast models should have run and forecast dimensions."""
+        if dims.get("time"):
+            self.add_warning(
+                "dimensions.time",
+                "Forecast models typically don't use TIME dimension (use RUN + FORECAST)",
+            )
+
+    def _check_observation_dimensions(self, dims: dict):
+        """Observation models should have a time dimension."""
+        if any(dims[flag] for flag in dims.keys() & _RUN_FORECAST_FLAGS):
+            self.add_warning(
+                "dimensions.run/forecast",
+                "Observation models typically don't use RUN/FORECAST dimensions (use TIME)",
+            )
+
+    def _check_aws_s3_source(self, source: dict):
+        """AWS S3 sources need a bucket."""
+        if "bucket" not in source:
+            self.add_error(
+                "source.bucket", "Missing required field 'bucket' for AWS S3 source"
+            )
+        if "region" not in source:
+            self.add_warning(
+                "source.region", "Missing 'region' - will default to us-east-1"
+            )
+
+    def _check_geostationary_grid(self, grid: dict):
+        """Geostationary projection needs projection_params."""
+        if "projection_params" not in grid:
             self.add_error(
                 "grid.projection_params",
                 "Missing required 'projection_params' for geostationary projection",
@@ -313,10 +463,6 @@ class ModelValidator:
 
     def _validate_schedule_section(self):
         """Validate the 'schedule' section (required)."""
-        if "schedule" not in self.data:
-            self.add_error("schedule", "Missing required section 'schedule'")
-            return
-
         schedule = self.data["schedule"]
         if not isinstance(schedule, dict):
             self.add_error("schedule", "Section must be a mapping")
@@ -367,13 +513,6 @@ class ModelValidator:
 
     def _validate_retention_section(self):
         """Validate the 'retention' section (optional but recommended)."""
-        if "retention" not in self.data:
-            self.add_warning(
-                "retention",
-                "Missing 'retention' section - data will be kept indefinitely",
-            )
-            return
-
         retention = self.data["retention"]
         if not isinstance(retention, dict):
             self.add_error("retention", "Section must be a mapping")
@@ -386,15 +525,12 @@ class ModelValidator:
 
     def _validate_precaching_section(self):
         """Validate the 'precaching' section (optional)."""
-        if "precaching" not in self.data:
-            return  # Optional section
-
         precaching = self.data["precaching"]
         if not isinstance(precaching, dict):
             self.add_error("precaching", "Section must be a mapping")
             return
 
-        self._optional_bool(precaching, "precaching.enabled")
+        self._check_fields(precaching, "precaching", _PRECACHING_FIELDS)
 
         if "parameters" in precaching:
             params = precaching["parameters"]
@@ -405,10 +541,6 @@ class ModelValidator:
 
     def _validate_parameters_section(self):
         """Validate the 'parameters' section (required)."""
-        if "parameters" not in self.data:
-            self.add_error("parameters", "Missing required section 'parameters'")
-            return
-
         params = self.data["parameters"]
         if not isinstance(params, list):
             self.add_error("parameters", "Section must be a list")
@@ -418,28 +550,25 @@ class ModelValidator:
             self.add_error("parameters", "Must have at least one parameter defined")
             return
 
-        seen_params = set()
+        # Duplicate names are allowed (same param with different level sets),
+        # so no duplicate tracking is done here
         for i, param in enumerate(params):
             path = f"parameters[{i}]"
             if not isinstance(param, dict):
                 self.add_error(path, "Each parameter must be a mapping")
                 continue
 
-            # Required: name
+            # Required: name (only string names count for composites)
             name = param.get("name")
             if name is None:
                 self.add_error(f"{path}.name", "Missing required field 'name'")
             elif not isinstance(name, str):
                 self.add_error(f"{path}.name", "Must be a string")
+            else:
+                self._defined_param_names.add(name)
 
-            # Warn on duplicates (but they're allowed with different levels)
-            if name in seen_params:
-                # This is actually OK - same param can have different level sets
-                pass
-            seen_params.add(name)
-
-            # Optional: description
-            self._optional_string(param, f"{path}.description")
+            # Optional: description, units, display_units
+            self._check_fields(param, path, _PARAMETER_FIELDS)
 
             # Required: levels
             if "levels" not in param:
@@ -453,20 +582,16 @@ class ModelValidator:
                 if style not in VALID_STYLES:
                     self.add_warning(
                         f"{path}.style",
-                        f"Unknown style '{style}'. Known styles: {', '.join(sorted(VALID_STYLES))}",
+                        f"Unknown style '{style}'. Known styles: {_VALID_STYLES_STR}",
                     )
 
-            # Optional: units
-            self._optional_string(param, f"{path}.units")
-            self._optional_string(param, f"{path}.display_units")
-
             # Optional: conversion
             if "conversion" in param:
                 conv = param["conversion"]
                 if conv not in VALID_CONVERSIONS:
                     self.add_warning(
                         f"{path}.conversion",
-                        f"Unknown conversion '{conv}'. Known: {', '.join(sorted(VALID_CONVERSIONS))}",
+                        f"Unknown conversion '{conv}'. Known: {_VALID_CONVERSIONS_STR}",
                     )
 
     def _validate_levels(self, levels: Any, path: str):
@@ -491,7 +616,7 @@ class ModelValidator:
             elif level_type not in VALID_LEVEL_TYPES:
                 self.add_warning(
                     f"{level_path}.type",
-                    f"Unknown level type '{level_type}'. Known types: {', '.join(sorted(VALID_LEVEL_TYPES))}",
+                    f"Unknown level type '{level_type}'. Known types: {_VALID_LEVEL_TYPES_STR}",
                 )
 
             # Check for value or values
@@ -509,20 +634,11 @@ class ModelValidator:
 
     def _validate_composites_section(self):
         """Validate the 'composites' section (optional)."""
-        if "composites" not in self.data:
-            return  # Optional section
-
         composites = self.data["composites"]
         if not isinstance(composites, list):
             self.add_error("composites", "Section must be a list")
             return
 
-        # Get defined parameter names for cross-reference
-        defined_params = set()
-        for param in self.data.get("parameters", []):
-            if isinstance(param, dict) and "name" in param:
-                defined_params.add(param["name"])
-
         for i, comp in enumerate(composites):
             path = f"composites[{i}]"
             if not isinstance(comp, dict):
@@ -544,7 +660,7 @@ class ModelValidator:
                     )
                 else:
                     for req in requires:
-                        if req not in defined_params:
+                        if req not in self._defined_param_names:
                             self.add_warning(
                                 f"{path}.requires",
                                 f"Required parameter '{req}' not defined in parameters section",
@@ -554,39 +670,98 @@ class ModelValidator:
     # Helper methods
     # =========================================================================
 
-    def _require_string(
-        self,
-        obj: dict,
-        path: str,
-        pattern: str | None = None,
-        pattern_desc: str | None = None,
-    ):
-        """Validate a required string field."""
-        field = path.split(".")[-1]
-        if field not in obj:
-            self.add_error(path, f"Missing required field '{field}'")
-            return
+    def _check_fields(self, obj: dict, path: str, rules: tuple[FieldRule, ...]):
+        """Apply a table of simple per-field checks to a mapping."""
+        for field, expected, required, pattern, pattern_desc in rules:
+            field_path = f"{path}.{field}"
+            if field not in obj:
+                if required:
+                    self.add_error(field_path, f"Missing required field '{field}'")
+                continue
 
-        value = obj[field]
-        if not isinstance(value, str):
-            self.add_error(path, "Must be a string")
-            return
+            value = obj[field]
+            if not isinstance(value, expected):
+                self.add_error(field_path, _TYPE_MESSAGES[expected])
+            elif pattern is not None and not pattern.match(value):
+                desc = pattern_desc or f"Must match pattern: {pattern.pattern}"
+                self.add_error(field_path, desc)
+
+
+# Top-level sections in validation order:
+# (section, severity if missing, message if missing, validator)
+_SECTION_SPECS = (
+    (
+        "model",
+        "error",
+        "Missing required section 'model'",
+        ModelValidator._validate_model_section,
+    ),
+    (
+        "dimensions",
+        "warning",
+        "Missing 'dimensions' section - will infer from schedule.type",
+        ModelValidator._validate_dimensions_section,
+    ),
+    (
+        "source",
+        "error",
+        "Missing required section 'source'",
+        ModelValidator._validate_source_section,
+    ),
+    (
+        "grid",
+        "error",
+        "Missing required section 'grid'",
+        ModelValidator._validate_grid_section,
+    ),
+    (
+        "schedule",
+        "error",
+        "Missing required section 'schedule'",
+        ModelValidator._validate_schedule_section,
+    ),
+    (
+        "retention",
+        "warning",
+        "Missing 'retention' section - data will be kept indefinitely",
+        ModelValidator._validate_retention_section,
+    ),
+    ("precaching", None, None, ModelValidator._validate_precaching_section),
+    (
+        "parameters",
+        "error",
+        "Missing required section 'parameters'",
+        ModelValidator._validate_parameters_section,
+    ),
+    ("composites", None, None, ModelValidator._validate_composites_section),
+)
+_SECTION_NAMES = frozenset(spec[0] for spec in _SECTION_SPECS)
+
+# Type-specific checks, keyed by the section's type/projection value
+_DIMENSION_TYPE_CHECKS = {
+    "forecast": ModelValidator._check_forecast_dimensions,
+    "observation": ModelValidator._check_observation_dimensions,
+}
+_SOURCE_TYPE_CHECKS = {
+    "aws_s3": ModelValidator._check_aws_s3_source,
+    "aws_s3_goes": ModelValidator._check_aws_s3_source,
+    "aws_s3_grib2": ModelValidator._check_aws_s3_source,
+}
+_PROJECTION_CHECKS = {
+    "geostationary": ModelValidator._check_geostationary_grid,
+}
 
-        if pattern and not re.match(pattern, value):
-            desc = pattern_desc or f"Must match pattern: {pattern}"
-            self.add_error(path, desc)
 
-    def _optional_string(self, obj: dict, path: str):
-        """Validate an optional string field."""
-        field = path.split(".")[-1]
-        if field in obj and not isinstance(obj[field], str):
-            self.add_error(path, "Must be a string")
+def _validate_file(
+    filename: str, cache_dir: Path | None = None
+) -> tuple[str, Sequence[ValidationError], Sequence[ValidationError], bool]:
+    """Validate one file, returning (filename, errors, warnings, is_valid).
 
-    def _optional_bool(self, obj: dict, path: str):
-        """Validate an optional boolean field."""
-        field = path.split(".")[-1]
-        if field in obj and not isinstance(obj[field], bool):
-            self.add_error(path, "Must be a boolean (true/false)")
+    The error and warning lists are empty tuples when there are none.
+    """
+    validator = ModelValidator(filename, cache_dir)
+    is_valid = validator.validate()
+    return filename, validator.errors or (), validator.warnings or (), is_valid
 
 
 def main():
@@ -613,16 +788,41 @@ def main():
         default=True,
         help="Show detailed output for valid files (default: True)",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Always re-parse files instead of reusing {CACHE_DIR_NAME}/",
+    )
 
     args = parser.parse_args()
 
+    # Parsed files are cached next to this script, keyed by path and mtime
+    cache_dir = None
+    if not args.no_cache:
+        cache_dir = Path(__file__).parent / CACHE_DIR_NAME
+        try:
+            cache_dir.mkdir(exist_ok=True)
+        except OSError:
+            cache_dir = None
+
     # Determine files to validate
     if args.files:
         files = [Path(f) for f in args.files]
     else:
         # Find all YAML files in current directory
         script_dir = Path(__file__).parent
-        files = sorted(script_dir.glob("*.yaml"))
+        with os.scandir(script_dir) as entries:
+            files = [
+                Path(path)
+                for path in sorted(
+                    e.path
+                    for e in entries
+                    if e.name.endswith(".yaml") and e.is_file()
+                )
+            ]
+
+    # Skip this script if it somehow has .yaml extension
+    files = [f for f in files if f.name != "validate.py"]
 
     if not files:
         print("No YAML files found to validate")
@@ -633,36 +833,44 @@ def main():
     total_warnings = 0
     valid_count = 0
 
-    for filepath in files:
-        # Skip this script if it somehow has .yaml extension
-        if filepath.name == "validate.py":
-            continue
+    to_validate = [str(f) for f in files]
 
-        validator = ModelValidator(str(filepath))
-        is_valid = validator.validate()
+    # Files are independent, so validate larger batches across processes;
+    # results come back in input order
+    if len(to_validate) >= PARALLEL_MIN_FILES:
+        with ProcessPoolExecutor() as executor:
+            results = list(
+                executor.map(_validate_file, to_validate, repeat(cache_dir))
+            )
+    else:
+        results = [_validate_file(f, cache_dir) for f in to_validate]
 
+    for filename, errors, warnings, is_valid in results:
+        # Build each file's report and write it in one go
+        name = Path(filename).name
+        buf: list[str] = []
         if is_valid:
             valid_count += 1
             if args.verbose:
-                print(f"OK {filepath.name}")
-                if validator.warnings and not args.quiet:
-                    for warning in validator.warnings:
-                        print(warning)
+                buf.append(f"OK {name}")
+                if warnings and not args.quiet:
+                    buf.extend(map(str, warnings))
         else:
-            print(f"INVALID {filepath.name}")
-            for error in validator.errors:
-                print(error)
-            total_errors += len(validator.errors)
+            buf.append(f"INVALID {name}")
+            buf.extend(map(str, errors))
+            total_errors += len(errors)
+
+        if warnings and not args.quiet and not is_valid:
+            buf.extend(map(str, warnings))
 
-        if validator.warnings and not args.quiet and not is_valid:
-            for warning in validator.warnings:
-                print(warning)
+        if buf:
+            sys.stdout.write("\n".join(buf) + "\n")
 
-        total_warnings += len(validator.warnings)
+        total_warnings += len(warnings)
 
     # Summary
     print()
-    file_count = len([f for f in files if f.name != "validate.py"])
+    file_count = len(files)
     if total_errors == 0:
         print(f"All {file_count} model configuration(s) valid")
         if total_warnings > 0 and not args.quiet:
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Tests for validate_styles.py.
+
+The schema checks need jsonschema-rs or fastjsonschema and are skipped
+without them.
+
+Usage:
+    python -m unittest test_validate_styles     # from config/styles/
+"""
+
+import copy
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import validate_styles  # noqa: E402
+from validate_styles import (  # noqa: E402
+    HEX_COLOR_PATTERN,
+    STYLE_FILE_SCHEMA,
+    _compile_schema,
+    is_hex_color,
+    iter_file_errors,
+    load_json,
+)
+
+STYLE_DIR = Path(__file__).parent
+STYLE_FILES = sorted(STYLE_DIR.glob("*.json"))
+
+_MISSING = object()
+
+
+def _set_first_stop(field, value):
+    def mutate(style):
+        stops = style.get("stops")
+        if not stops:
+            return False
+        if value is _MISSING:
+            del stops[0][field]
+        else:
+            stops[0][field] = value
+        return True
+
+    return mutate
+
+
+def _set_field(field, value):
+    def mutate(style):
+        style[field] = value
+        return True
+
+    return mutate
+
+
+def _drop_field(field):
+    def mutate(style):
+        return style.pop(field, _MISSING) is not _MISSING
+
+    return mutate
+
+
+# Breakages applied to each style in turn; none touch range ordering or the
+# default flag, which the schema leaves to separate checks
+MUTATIONS = {
+    "bad type": _set_field("type", "bogus"),
+    "no type": _drop_field("type"),
+    "short color": _set_first_stop("color", "#12345"),
+    "bool value": _set_first_stop("value", True),
+    "no value": _set_first_stop("value", _MISSING),
+    "numeric label": _set_first_stop("label", 3),
+    "bad transform": _set_field("transform", "linear"),
+    "bad range": _set_field("range", {"min": "0"}),
+}
+
+
+def hand_verdict(filepath: Path) -> bool:
+    """Return True if the hand-written validators find no errors."""
+    with mock.patch.object(validate_styles, "_SCHEMA_IS_VALID", None):
+        return not list(iter_file_errors(filepath))
+
+
+class SchemaAgreementTest(unittest.TestCase):
+    """STYLE_FILE_SCHEMA must accept exactly what iter_file_errors accepts."""
+
+    def setUp(self):
+        self.schema_is_valid = _compile_schema(STYLE_FILE_SCHEMA)
+        if self.schema_is_valid is None:
+            self.skipTest("needs jsonschema-rs or fastjsonschema")
+
+    def assertSameVerdict(self, filepath: Path) -> None:
+        self.assertEqual(
+            self.schema_is_valid(load_json(filepath)), hand_verdict(filepath)
+        )
+
+    def test_repo_style_files(self):
+        self.assertIn(STYLE_DIR / "schema.example.json", STYLE_FILES)
+        for filepath in STYLE_FILES:
+            with self.subTest(file=filepath.name):
+                self.assertSameVerdict(filepath)
+
+    def test_broken_styles(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            filepath = Path(tmp) / "broken.json"
+            for source in STYLE_FILES:
+                data = load_json(source)
+                for style_id, style in data["styles"].items():
+                    if style_id.startswith("_"):
+                        continue
+                    for name, mutate in MUTATIONS.items():
+                        broken = copy.deepcopy(data)
+                        if not mutate(broken["styles"][style_id]):
+                            continue
+                        filepath.write_text(json.dumps(broken))
+                        with self.subTest(file=source.name, style=style_id, case=name):
+                            self.assertSameVerdict(filepath)
+
+
+def iter_stop_colors():
+    """Yield (file, style, color) for every string stop color in the repo."""
+    for filepath in STYLE_FILES:
+        for style_id, style in load_json(filepath)["styles"].items():
+            if not isinstance(style, dict):
+                continue
+            for stop in style.get("stops") or ():
+                color = stop.get("color")
+                if isinstance(color, str):
+                    yield filepath.name, style_id, color
+
+
+class HexColorTest(unittest.TestCase):
+    """is_hex_color must agree with HEX_COLOR_PATTERN."""
+
+    def assertSameVerdict(self, color: str) -> None:
+        self.assertEqual(is_hex_color(color), bool(HEX_COLOR_PATTERN.match(color)))
+
+    def test_repo_stop_colors(self):
+        count = 0
+        for filename, style_id, color in iter_stop_colors():
+            if color == "transparent":
+                continue
+            count += 1
+            with self.subTest(file=filename, style=style_id, color=color):
+                self.assertSameVerdict(color)
+        self.assertGreater(count, 0)
+
+    def test_malformed_colors(self):
+        for color in ("#12345", "#1234567", "#GGGGGG", "123456#", "#12345G", "#"):
+            with self.subTest(color=color):
+                self.assertSameVerdict(color)
+        # Only the pattern accepts a trailing newline, via "$"
+        self.assertFalse(is_hex_color("#123456\n"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,495 +3,824 @@
 Style JSON Validation Script
 
 Validates all style JSON files in config/styles/ against the schema defined
-in schema.example.json.
+in schema.example.json. When jsonschema-rs or fastjsonschema is installed,
+files are first run through a compiled JSON Schema and only re-walked by the
+detailed validators if it rejects them.
 
 Usage:
     python validate_styles.py [--verbose]
+    python validate_styles.py --no-cache    # re-validate every file
 
 Exit codes:
     0 - All files valid
     1 - Validation errors found
 """
 
+import argparse
+import hashlib
+import importlib.util
 import json
+import mmap
+import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from dataclasses import dataclass
+from itertools import repeat
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
+
+# orjson parses straight from bytes; its JSONDecodeError subclasses json's
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional schema engines; the hand-written validators cover everything
+try:
+    import jsonschema_rs
+except ImportError:
+    jsonschema_rs = None
+
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
 
 # Valid style types
-VALID_STYLE_TYPES = {
-    "gradient",
-    "contour",
-    "filled_contour",
-    "wind_barbs",
-    "wind_arrows",
-}
+VALID_STYLE_TYPES = frozenset(
+    {
+        "gradient",
+        "contour",
+        "filled_contour",
+        "wind_barbs",
+        "wind_arrows",
+    }
+)
 
 # Valid transform types
-VALID_TRANSFORM_TYPES = {
-    "none",
-    "linear",
-    "pa_to_hpa",
-    "mps_to_knots",
-    "k_to_c",
-    "m_to_km",
-}
+VALID_TRANSFORM_TYPES = frozenset(
+    {
+        "none",
+        "linear",
+        "pa_to_hpa",
+        "mps_to_knots",
+        "k_to_c",
+        "m_to_km",
+    }
+)
 
 # Valid interpolation types
-VALID_INTERPOLATION_TYPES = {"linear", "step", "nearest"}
+VALID_INTERPOLATION_TYPES = frozenset({"linear", "step", "nearest"})
 
 # Valid out_of_range types
-VALID_OUT_OF_RANGE_TYPES = {"clamp", "extend", "transparent"}
+VALID_OUT_OF_RANGE_TYPES = frozenset({"clamp", "extend", "transparent"})
+
+
+def _format_choices(values: frozenset) -> str:
+    """Render valid values for error messages, in a stable order."""
+    return "{%s}" % ", ".join(map(repr, sorted(values)))
+
+
+_VALID_STYLE_TYPES_STR = _format_choices(VALID_STYLE_TYPES)
+_VALID_TRANSFORM_TYPES_STR = _format_choices(VALID_TRANSFORM_TYPES)
+_VALID_INTERPOLATION_TYPES_STR = _format_choices(VALID_INTERPOLATION_TYPES)
+_VALID_OUT_OF_RANGE_TYPES_STR = _format_choices(VALID_OUT_OF_RANGE_TYPES)
 
 # Hex color pattern
 HEX_COLOR_PATTERN = re.compile(r"^#[0-9A-Fa-f]{6}([0-9A-Fa-f]{2})?$")
+HEX_DIGITS = "0123456789abcdefABCDEF"
+
+# Numeric option fields, in the order their errors are reported
+CONTOUR_NUMBER_FIELDS = (
+    "interval",
+    "base",
+    "min_value",
+    "max_value",
+    "line_width",
+    "major_interval",
+    "major_line_width",
+    "label_font_size",
+    "smoothing_passes",
+)
+WIND_NUMBER_FIELDS = (
+    "spacing",
+    "size",
+    "line_width",
+    "calm_threshold",
+    "min_length",
+    "max_length",
+)
+
+# Where an error occurred: keys and list indexes, formatted only on error
+ErrorPath = tuple[str | int, ...]
+
+# Messages shared by several error sites
+_MSG_NUMBER = "Field must be number"
+_MSG_MISSING_TYPE = "Missing required field 'type'"
+
+# Marks an absent key in dict.get lookups
+_SENTINEL = object()
+
+# The hashes of files that last validated clean are cached next to this script
+CACHE_DIR_NAME = ".validate_cache"
+
+# Generated schema validators are shared by every checkout, under the user's
+# cache directory
+VALIDATOR_CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "jgc_styles"
+)
+CLEAN_CACHE_NAME = "clean_styles.json"
+
+# Files at least this large are memory-mapped rather than read when orjson
+# is available; below it the mapping costs more than the copy it saves
+MMAP_MIN_BYTES = 64 * 1024
+
+# Use a process pool once there are enough files to amortize its startup
+PARALLEL_MIN_FILES = 4
+
+# JSON Schema mirroring the validate_* helpers below. It is only ever used to
+# accept a file: anything it rejects is re-checked by the hand-written
+# validators, which produce the detailed messages. It must therefore never be
+# looser than those validators. Range ordering (min < max) and the single
+# default style cannot be expressed here and are checked separately.
+_NUMBER = {"type": "number"}
+_COLOR = {
+    "anyOf": [
+        {"const": "transparent"},
+        {"type": "string", "pattern": HEX_COLOR_PATTERN.pattern},
+    ]
+}
+STYLE_FILE_SCHEMA = {
+    "$schema": "http://json-schema.org/draft-07/schema#",
+    "type": "object",
+    "required": ["version", "styles"],
+    "properties": {
+        "version": {"const": "1.0"},
+        "metadata": {"type": "object"},
+        "styles": {
+            "type": "object",
+            "patternProperties": {"^_": {}},
+            "additionalProperties": {"$ref": "#/definitions/style"},
+        },
+    },
+    "definitions": {
+        "color": _COLOR,
+        "stop": {
+            "type": "object",
+            "required": ["value", "color"],
+            "properties": {
+                "value": _NUMBER,
+                "color": _COLOR,
+                "label": {"type": "string"},
+            },
+        },
+        "stops": {"type": "array", "items": {"$ref": "#/definitions/stop"}},
+        "transform": {
+            "type": "object",
+            "required": ["type"],
+            "properties": {
+                # validate_transform compares the lowercased type. Spelled
+                # out with character classes and no trailing newline so the
+                # pattern means the same under Python and ECMA regexes.
+                "type": {
+                    "type": "string",
+                    "pattern": "^(?:%s)$"
+                    % "|".join(
+                        "".join(f"[{c.upper()}{c}]" if c.isalpha() else c for c in t)
+                        for t in sorted(VALID_TRANSFORM_TYPES)
+                    ),
+                    "not": {"pattern": r"\n"},
+                }
+            },
+            "if": {"properties": {"type": {"const": "linear"}}},
+            "then": {"properties": {"scale": _NUMBER, "offset": _NUMBER}},
+        },
+        "range": {
+            "type": "object",
+            "properties": {"min": _NUMBER, "max": _NUMBER},
+        },
+        "legend": {
+            "type": "object",
+            "properties": {
+                "title": {"type": "string"},
+                "labels": {"type": "array", "items": {"type": "string"}},
+            },
+        },
+        "contour": {
+            "type": "object",
+            "properties": {
+                **dict.fromkeys(CONTOUR_NUMBER_FIELDS, _NUMBER),
+                "line_color": _COLOR,
+                "labels": {"type": "boolean"},
+            },
+        },
+        "wind": {
+            "type": "object",
+            "properties": {
+                **dict.fromkeys(WIND_NUMBER_FIELDS, _NUMBER),
+                "color": _COLOR,
+                "direction_from": {"type": "boolean"},
+            },
+        },
+        "color_by_speed": {
+            "type": "object",
+            "properties": {
+                "enabled": {"type": "boolean"},
+                "stops": {"$ref": "#/definitions/stops"},
+                "interpolation": {"enum": sorted(VALID_INTERPOLATION_TYPES)},
+            },
+        },
+        "style": {
+            "type": "object",
+            "required": ["type"],
+            "properties": {
+                "type": {"enum": sorted(VALID_STYLE_TYPES)},
+                "name": {"type": "string"},
+                "description": {"type": "string"},
+                "default": {"type": "boolean"},
+                "units": {"type": "string"},
+                "transform": {"$ref": "#/definitions/transform"},
+                "range": {"$ref": "#/definitions/range"},
+                "legend": {"$ref": "#/definitions/legend"},
+            },
+            "allOf": [
+                {
+                    "if": {
+                        "properties": {"type": {"enum": ["gradient", "filled_contour"]}}
+                    },
+                    "then": {
+                        "required": ["stops"],
+                        "properties": {
+                            "stops": {
+                                "type": "array",
+                                "minItems": 2,
+                                "items": {"$ref": "#/definitions/stop"},
+                            },
+                            "interpolation": {
+                                "enum": sorted(VALID_INTERPOLATION_TYPES)
+                            },
+                            "out_of_range": {"enum": sorted(VALID_OUT_OF_RANGE_TYPES)},
+                        },
+                    },
+                },
+                {
+                    "if": {"properties": {"type": {"const": "contour"}}},
+                    "then": {
+                        "properties": {"contour": {"$ref": "#/definitions/contour"}}
+                    },
+                },
+                {
+                    "if": {
+                        "properties": {"type": {"enum": ["wind_barbs", "wind_arrows"]}}
+                    },
+                    "then": {
+                        "properties": {
+                            "wind": {"$ref": "#/definitions/wind"},
+                            "color_by_speed": {"$ref": "#/definitions/color_by_speed"},
+                        }
+                    },
+                },
+            ],
+        },
+    },
+}
+
+
+def _load_generated_validator(schema: dict):
+    """Return fastjsonschema's validate function for schema.
+
+    The generated source is kept in VALIDATOR_CACHE_DIR, keyed by a hash of
+    the schema and the fastjsonschema version, so later runs import it (and
+    its bytecode) instead of generating it again.
+    """
+    digest = hashlib.sha256(
+        (fastjsonschema.VERSION + json.dumps(schema, sort_keys=True)).encode()
+    ).hexdigest()[:16]
+    path = VALIDATOR_CACHE_DIR / f"validator_{digest}.py"
+    try:
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(fastjsonschema.compile_to_code(schema))
+            os.replace(tmp, path)
+        spec = importlib.util.spec_from_file_location(path.stem, path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module.validate
+    except (OSError, SyntaxError, AttributeError):
+        return fastjsonschema.compile(schema)
+
+
+def _compile_schema(schema: dict):
+    """Return an is-valid predicate for schema, or None without an engine.
+
+    Prefers jsonschema-rs, which walks the parsed objects in native code,
+    over fastjsonschema's generated Python.
+    """
+    if jsonschema_rs is not None:
+        return jsonschema_rs.validator_for(schema).is_valid
+    if fastjsonschema is None:
+        return None
 
+    validate = _load_generated_validator(schema)
 
+    def is_valid(data: Any) -> bool:
+        try:
+            validate(data)
+        except fastjsonschema.JsonSchemaException:
+            return False
+        return True
+
+    return is_valid
+
+
+# Set by load_schema(); until then schema_accepts rejects everything and the
+# hand-written validators check each file
+_SCHEMA_IS_VALID = None
+_SCHEMA_LOADED = False
+
+
+def load_schema() -> None:
+    """Compile STYLE_FILE_SCHEMA for schema_accepts, once per process.
+
+    Pool workers forked after main() has loaded it inherit the compiled
+    validator, so this is then a no-op.
+    """
+    global _SCHEMA_IS_VALID, _SCHEMA_LOADED
+    if not _SCHEMA_LOADED:
+        _SCHEMA_IS_VALID = _compile_schema(STYLE_FILE_SCHEMA)
+        _SCHEMA_LOADED = True
+
+
+@dataclass(frozen=True, slots=True)
 class ValidationError:
-    def __init__(self, file: str, path: str, message: str):
-        self.file = file
-        self.path = path
-        self.message = message
+    file: str
+    path: str
+    message: str
 
     def __str__(self):
         return f"{self.file}: {self.path}: {self.message}"
 
 
-def validate_color(color: Any, path: str, errors: list, file: str):
+def format_path(path: ErrorPath) -> str:
+    """Render ("styles", "a", "stops", 0) as styles.a.stops[0]."""
+    out = []
+    for part in path:
+        if type(part) is int:
+            out.append(f"[{part}]")
+        elif out:
+            out.append(f".{part}")
+        else:
+            out.append(part)
+    return "".join(out)
+
+
+def _err(errors: list, file: str, path: ErrorPath, message: str):
+    """Record a validation error, formatting its path only now."""
+    errors.append(ValidationError(file, format_path(path), message))
+
+
+def _is_number(value: Any) -> bool:
+    """Return True for JSON numbers; bool is an int subclass but not a number."""
+    return type(value) is not bool and isinstance(value, (int, float))
+
+
+def schema_accepts(data: Any) -> bool:
+    """Return True if the compiled schema accepts data.
+
+    Always False until load_schema() has run, or without a schema engine.
+    """
+    return _SCHEMA_IS_VALID is not None and _SCHEMA_IS_VALID(data)
+
+
+def is_hex_color(color: str) -> bool:
+    """Return True for a well-formed #RRGGBB/#RRGGBBAA color.
+
+    A fast path only: anything it rejects is re-checked against
+    HEX_COLOR_PATTERN, so it must never accept what the pattern rejects.
+    """
+    n = len(color)
+    return (n == 7 or n == 9) and color[0] == "#" and not color[1:].strip(HEX_DIGITS)
+
+
+def validate_color(color: Any, path: ErrorPath, errors: list, file: str):
     """Validate a color value."""
     if color == "transparent":
         return
     if not isinstance(color, str):
-        errors.append(
-            ValidationError(
-                file, path, f"Color must be string, got {type(color).__name__}"
-            )
-        )
+        _err(errors, file, path, f"Color must be string, got {type(color).__name__}")
         return
-    if not HEX_COLOR_PATTERN.match(color):
-        errors.append(
-            ValidationError(
-                file,
-                path,
-                f"Invalid color format '{color}'. Expected #RRGGBB or #RRGGBBAA",
-            )
+    if not is_hex_color(color) and not HEX_COLOR_PATTERN.match(color):
+        _err(
+            errors,
+            file,
+            path,
+            f"Invalid color format '{color}'. Expected #RRGGBB or #RRGGBBAA",
         )
 
 
-def validate_stop(stop: Any, index: int, path: str, errors: list, file: str):
-    """Validate a color stop."""
-    stop_path = f"{path}[{index}]"
+def validate_stops(stops: list, path: ErrorPath, errors: list, file: str):
+    """Validate a list of color stops.
 
-    if not isinstance(stop, dict):
-        errors.append(
-            ValidationError(
-                file, stop_path, f"Stop must be object, got {type(stop).__name__}"
-            )
-        )
-        return
+    Gradient tables can be long, so the per-stop checks are inlined here with
+    builtins bound to locals; only colors that is_hex_color rejects go through
+    validate_color.
+    """
+    _isinstance = isinstance
+    number_types = (int, float)
+    _is_hex_color = is_hex_color
 
-    # Required: value
-    if "value" not in stop:
-        errors.append(
-            ValidationError(file, stop_path, "Missing required field 'value'")
-        )
-    elif not isinstance(stop["value"], (int, float)):
-        errors.append(
-            ValidationError(
+    for i, stop in enumerate(stops):
+        if not _isinstance(stop, dict):
+            _err(
+                errors,
                 file,
-                f"{stop_path}.value",
-                f"Value must be number, got {type(stop['value']).__name__}",
+                path + (i,),
+                f"Stop must be object, got {type(stop).__name__}",
+            )
+            continue
+
+        # Required: value
+        value = stop.get("value", _SENTINEL)
+        if value is _SENTINEL:
+            _err(errors, file, path + (i,), "Missing required field 'value'")
+        elif type(value) is bool or not _isinstance(value, number_types):
+            _err(
+                errors,
+                file,
+                path + (i, "value"),
+                f"Value must be number, got {type(value).__name__}",
             )
-        )
-
-    # Required: color
-    if "color" not in stop:
-        errors.append(
-            ValidationError(file, stop_path, "Missing required field 'color'")
-        )
-    else:
-        validate_color(stop["color"], f"{stop_path}.color", errors, file)
 
-    # Optional: label (string)
-    if "label" in stop and not isinstance(stop["label"], str):
-        errors.append(
-            ValidationError(
+        # Required: color
+        color = stop.get("color", _SENTINEL)
+        if color is _SENTINEL:
+            _err(errors, file, path + (i,), "Missing required field 'color'")
+        elif not (_isinstance(color, str) and _is_hex_color(color)):
+            validate_color(color, path + (i, "color"), errors, file)
+
+        # Optional: label (string)
+        label = stop.get("label", _SENTINEL)
+        if label is not _SENTINEL and not _isinstance(label, str):
+            _err(
+                errors,
                 file,
-                f"{stop_path}.label",
-                f"Label must be string, got {type(stop['label']).__name__}",
+                path + (i, "label"),
+                f"Label must be string, got {type(label).__name__}",
             )
-        )
 
 
-def validate_transform(transform: Any, path: str, errors: list, file: str):
+def validate_transform(transform: Any, path: ErrorPath, errors: list, file: str):
     """Validate a transform object."""
     if not isinstance(transform, dict):
-        errors.append(
-            ValidationError(
-                file, path, f"Transform must be object, got {type(transform).__name__}"
-            )
+        _err(
+            errors,
+            file,
+            path,
+            f"Transform must be object, got {type(transform).__name__}",
         )
         return
 
     if "type" not in transform:
-        errors.append(ValidationError(file, path, "Missing required field 'type'"))
+        _err(errors, file, path, _MSG_MISSING_TYPE)
     elif transform["type"].lower() not in VALID_TRANSFORM_TYPES:
-        errors.append(
-            ValidationError(
-                file,
-                f"{path}.type",
-                f"Invalid transform type '{transform['type']}'. Valid types: {VALID_TRANSFORM_TYPES}",
-            )
+        _err(
+            errors,
+            file,
+            path + ("type",),
+            f"Invalid transform type '{transform['type']}'. Valid types: {_VALID_TRANSFORM_TYPES_STR}",
         )
 
     # For 'linear' transform, scale/offset are optional numbers
     if transform.get("type") == "linear":
-        if "scale" in transform and not isinstance(transform["scale"], (int, float)):
-            errors.append(
-                ValidationError(file, f"{path}.scale", "Scale must be a number")
-            )
-        if "offset" in transform and not isinstance(transform["offset"], (int, float)):
-            errors.append(
-                ValidationError(file, f"{path}.offset", "Offset must be a number")
-            )
+        scale = transform.get("scale", _SENTINEL)
+        if scale is not _SENTINEL and not _is_number(scale):
+            _err(errors, file, path + ("scale",), "Scale must be a number")
+        offset = transform.get("offset", _SENTINEL)
+        if offset is not _SENTINEL and not _is_number(offset):
+            _err(errors, file, path + ("offset",), "Offset must be a number")
 
 
-def validate_range(range_obj: Any, path: str, errors: list, file: str):
+def validate_range(range_obj: Any, path: ErrorPath, errors: list, file: str):
     """Validate a range object."""
     if not isinstance(range_obj, dict):
-        errors.append(
-            ValidationError(
-                file, path, f"Range must be object, got {type(range_obj).__name__}"
-            )
+        _err(
+            errors, file, path, f"Range must be object, got {type(range_obj).__name__}"
         )
         return
 
-    if "min" in range_obj and not isinstance(range_obj["min"], (int, float)):
-        errors.append(ValidationError(file, f"{path}.min", "Min must be a number"))
-    if "max" in range_obj and not isinstance(range_obj["max"], (int, float)):
-        errors.append(ValidationError(file, f"{path}.max", "Max must be a number"))
-
-    if "min" in range_obj and "max" in range_obj:
-        if isinstance(range_obj["min"], (int, float)) and isinstance(
-                range_obj["max"], (int, float)
-        ):
-            if range_obj["min"] >= range_obj["max"]:
-                errors.append(
-                    ValidationError(
-                        file,
-                        path,
-                        f"Min ({range_obj['min']}) must be less than max ({range_obj['max']})",
-                    )
-                )
+    min_value = range_obj.get("min", _SENTINEL)
+    max_value = range_obj.get("max", _SENTINEL)
+    min_ok = _is_number(min_value)
+    max_ok = _is_number(max_value)
+    if min_value is not _SENTINEL and not min_ok:
+        _err(errors, file, path + ("min",), "Min must be a number")
+    if max_value is not _SENTINEL and not max_ok:
+        _err(errors, file, path + ("max",), "Max must be a number")
+
+    if min_ok and max_ok and min_value >= max_value:
+        _err(
+            errors, file, path, f"Min ({min_value}) must be less than max ({max_value})"
+        )
 
 
-def validate_legend(legend: Any, path: str, errors: list, file: str):
+def validate_legend(legend: Any, path: ErrorPath, errors: list, file: str):
     """Validate a legend object."""
     if not isinstance(legend, dict):
-        errors.append(
-            ValidationError(
-                file, path, f"Legend must be object, got {type(legend).__name__}"
-            )
-        )
+        _err(errors, file, path, f"Legend must be object, got {type(legend).__name__}")
         return
 
     if "title" in legend and not isinstance(legend["title"], str):
-        errors.append(ValidationError(file, f"{path}.title", "Title must be string"))
+        _err(errors, file, path + ("title",), "Title must be string")
 
     if "labels" in legend:
         if not isinstance(legend["labels"], list):
-            errors.append(
-                ValidationError(file, f"{path}.labels", "Labels must be array")
-            )
+            _err(errors, file, path + ("labels",), "Labels must be array")
         else:
             for i, label in enumerate(legend["labels"]):
                 if not isinstance(label, str):
-                    errors.append(
-                        ValidationError(
-                            file,
-                            f"{path}.labels[{i}]",
-                            f"Label must be string, got {type(label).__name__}",
-                        )
+                    _err(
+                        errors,
+                        file,
+                        path + ("labels", i),
+                        f"Label must be string, got {type(label).__name__}",
                     )
 
 
-def validate_contour(contour: Any, path: str, errors: list, file: str):
+def validate_contour(contour: Any, path: ErrorPath, errors: list, file: str):
     """Validate contour-specific options."""
     if not isinstance(contour, dict):
-        errors.append(
-            ValidationError(
-                file, path, f"Contour must be object, got {type(contour).__name__}"
-            )
+        _err(
+            errors, file, path, f"Contour must be object, got {type(contour).__name__}"
         )
         return
 
-    number_fields = [
-        "interval",
-        "base",
-        "min_value",
-        "max_value",
-        "line_width",
-        "major_interval",
-        "major_line_width",
-        "label_font_size",
-        "smoothing_passes",
-    ]
-    for field in number_fields:
-        if field in contour and not isinstance(contour[field], (int, float)):
-            errors.append(
-                ValidationError(file, f"{path}.{field}", f"Field must be number")
-            )
+    for field in CONTOUR_NUMBER_FIELDS:
+        value = contour.get(field, _SENTINEL)
+        if value is not _SENTINEL and not _is_number(value):
+            _err(errors, file, path + (field,), _MSG_NUMBER)
 
     if "line_color" in contour:
-        validate_color(contour["line_color"], f"{path}.line_color", errors, file)
+        validate_color(contour["line_color"], path + ("line_color",), errors, file)
 
     if "labels" in contour and not isinstance(contour["labels"], bool):
-        errors.append(ValidationError(file, f"{path}.labels", "Labels must be boolean"))
+        _err(errors, file, path + ("labels",), "Labels must be boolean")
 
 
-def validate_wind(wind: Any, path: str, errors: list, file: str):
+def validate_wind(wind: Any, path: ErrorPath, errors: list, file: str):
     """Validate wind-specific options."""
     if not isinstance(wind, dict):
-        errors.append(
-            ValidationError(
-                file, path, f"Wind must be object, got {type(wind).__name__}"
-            )
-        )
+        _err(errors, file, path, f"Wind must be object, got {type(wind).__name__}")
         return
 
-    number_fields = [
-        "spacing",
-        "size",
-        "line_width",
-        "calm_threshold",
-        "min_length",
-        "max_length",
-    ]
-    for field in number_fields:
-        if field in wind and not isinstance(wind[field], (int, float)):
-            errors.append(
-                ValidationError(file, f"{path}.{field}", f"Field must be number")
-            )
+    for field in WIND_NUMBER_FIELDS:
+        value = wind.get(field, _SENTINEL)
+        if value is not _SENTINEL and not _is_number(value):
+            _err(errors, file, path + (field,), _MSG_NUMBER)
 
     if "color" in wind:
-        validate_color(wind["color"], f"{path}.color", errors, file)
+        validate_color(wind["color"], path + ("color",), errors, file)
 
     if "direction_from" in wind and not isinstance(wind["direction_from"], bool):
-        errors.append(
-            ValidationError(
-                file, f"{path}.direction_from", "direction_from must be boolean"
-            )
-        )
+        _err(errors, file, path + ("direction_from",), "direction_from must be boolean")
 
 
-def validate_color_by_speed(cbs: Any, path: str, errors: list, file: str):
+def validate_color_by_speed(cbs: Any, path: ErrorPath, errors: list, file: str):
     """Validate color_by_speed options."""
     if not isinstance(cbs, dict):
-        errors.append(ValidationError(file, path, f"color_by_speed must be object"))
+        _err(errors, file, path, f"color_by_speed must be object")
         return
 
     if "enabled" in cbs and not isinstance(cbs["enabled"], bool):
-        errors.append(
-            ValidationError(file, f"{path}.enabled", "enabled must be boolean")
-        )
+        _err(errors, file, path + ("enabled",), "enabled must be boolean")
 
     if "stops" in cbs:
         if not isinstance(cbs["stops"], list):
-            errors.append(ValidationError(file, f"{path}.stops", "stops must be array"))
+            _err(errors, file, path + ("stops",), "stops must be array")
         else:
-            for i, stop in enumerate(cbs["stops"]):
-                validate_stop(stop, i, f"{path}.stops", errors, file)
+            validate_stops(cbs["stops"], path + ("stops",), errors, file)
 
     if "interpolation" in cbs and cbs["interpolation"] not in VALID_INTERPOLATION_TYPES:
-        errors.append(
-            ValidationError(
-                file,
-                f"{path}.interpolation",
-                f"Invalid interpolation '{cbs['interpolation']}'. Valid: {VALID_INTERPOLATION_TYPES}",
-            )
+        _err(
+            errors,
+            file,
+            path + ("interpolation",),
+            f"Invalid interpolation '{cbs['interpolation']}'. Valid: {_VALID_INTERPOLATION_TYPES_STR}",
         )
 
 
-def validate_style(style_id: str, style: Any, path: str, errors: list, file: str):
+def validate_style(style_id: str, style: Any, path: ErrorPath, errors: list, file: str):
     """Validate a single style definition."""
     if not isinstance(style, dict):
-        errors.append(
-            ValidationError(
-                file, path, f"Style must be object, got {type(style).__name__}"
-            )
-        )
+        _err(errors, file, path, f"Style must be object, got {type(style).__name__}")
         return
 
     # Required: type
     if "type" not in style:
-        errors.append(ValidationError(file, path, "Missing required field 'type'"))
+        _err(errors, file, path, _MSG_MISSING_TYPE)
         return
 
     style_type = style["type"]
-    if style_type not in VALID_STYLE_TYPES:
-        errors.append(
-            ValidationError(
-                file,
-                f"{path}.type",
-                f"Invalid style type '{style_type}'. Valid types: {VALID_STYLE_TYPES}",
-            )
+    check_type = _STYLE_TYPE_CHECKS.get(style_type)
+    if check_type is None:
+        _err(
+            errors,
+            file,
+            path + ("type",),
+            f"Invalid style type '{style_type}'. Valid types: {_VALID_STYLE_TYPES_STR}",
         )
         return
 
     # Optional common fields
     if "name" in style and not isinstance(style["name"], str):
-        errors.append(ValidationError(file, f"{path}.name", "Name must be string"))
+        _err(errors, file, path + ("name",), "Name must be string")
 
     if "description" in style and not isinstance(style["description"], str):
-        errors.append(
-            ValidationError(file, f"{path}.description", "Description must be string")
-        )
+        _err(errors, file, path + ("description",), "Description must be string")
 
     if "default" in style and not isinstance(style["default"], bool):
-        errors.append(
-            ValidationError(file, f"{path}.default", "Default must be boolean")
-        )
+        _err(errors, file, path + ("default",), "Default must be boolean")
 
     if "units" in style and not isinstance(style["units"], str):
-        errors.append(ValidationError(file, f"{path}.units", "Units must be string"))
+        _err(errors, file, path + ("units",), "Units must be string")
 
     if "transform" in style:
-        validate_transform(style["transform"], f"{path}.transform", errors, file)
+        validate_transform(style["transform"], path + ("transform",), errors, file)
 
     if "range" in style:
-        validate_range(style["range"], f"{path}.range", errors, file)
+        validate_range(style["range"], path + ("range",), errors, file)
 
     if "legend" in style:
-        validate_legend(style["legend"], f"{path}.legend", errors, file)
+        validate_legend(style["legend"], path + ("legend",), errors, file)
 
     # Type-specific validation
-    if style_type in ("gradient", "filled_contour"):
-        # Require stops for gradient/filled_contour
-        if "stops" not in style:
-            errors.append(
-                ValidationError(
-                    file, path, f"Style type '{style_type}' requires 'stops' array"
-                )
-            )
-        elif not isinstance(style["stops"], list):
-            errors.append(ValidationError(file, f"{path}.stops", "Stops must be array"))
-        elif len(style["stops"]) < 2:
-            errors.append(
-                ValidationError(
-                    file, f"{path}.stops", "Stops must have at least 2 entries"
-                )
-            )
-        else:
-            for i, stop in enumerate(style["stops"]):
-                validate_stop(stop, i, f"{path}.stops", errors, file)
-
-        if (
-                "interpolation" in style
-                and style["interpolation"] not in VALID_INTERPOLATION_TYPES
-        ):
-            errors.append(
-                ValidationError(
-                    file,
-                    f"{path}.interpolation",
-                    f"Invalid interpolation '{style['interpolation']}'. Valid: {VALID_INTERPOLATION_TYPES}",
-                )
-            )
+    check_type(style, path, errors, file)
 
-        if (
-                "out_of_range" in style
-                and style["out_of_range"] not in VALID_OUT_OF_RANGE_TYPES
-        ):
-            errors.append(
-                ValidationError(
-                    file,
-                    f"{path}.out_of_range",
-                    f"Invalid out_of_range '{style['out_of_range']}'. Valid: {VALID_OUT_OF_RANGE_TYPES}",
-                )
-            )
 
-    elif style_type == "contour":
-        if "contour" in style:
-            validate_contour(style["contour"], f"{path}.contour", errors, file)
+def _check_gradient_style(style: dict, path: ErrorPath, errors: list, file: str):
+    """Validate gradient/filled_contour options; stops are required."""
+    if "stops" not in style:
+        _err(
+            errors, file, path, f"Style type '{style['type']}' requires 'stops' array"
+        )
+    elif not isinstance(style["stops"], list):
+        _err(errors, file, path + ("stops",), "Stops must be array")
+    elif len(style["stops"]) < 2:
+        _err(errors, file, path + ("stops",), "Stops must have at least 2 entries")
+    else:
+        validate_stops(style["stops"], path + ("stops",), errors, file)
+
+    if (
+        "interpolation" in style
+        and style["interpolation"] not in VALID_INTERPOLATION_TYPES
+    ):
+        _err(
+            errors,
+            file,
+            path + ("interpolation",),
+            f"Invalid interpolation '{style['interpolation']}'. Valid: {_VALID_INTERPOLATION_TYPES_STR}",
+        )
+
+    if (
+        "out_of_range" in style
+        and style["out_of_range"] not in VALID_OUT_OF_RANGE_TYPES
+    ):
+        _err(
+            errors,
+            file,
+            path + ("out_of_range",),
+            f"Invalid out_of_range '{style['out_of_range']}'. Valid: {_VALID_OUT_OF_RANGE_TYPES_STR}",
+        )
 
-    elif style_type in ("wind_barbs", "wind_arrows"):
-        if "wind" in style:
-            validate_wind(style["wind"], f"{path}.wind", errors, file)
 
-        if "color_by_speed" in style:
-            validate_color_by_speed(
-                style["color_by_speed"], f"{path}.color_by_speed", errors, file
-            )
+def _check_contour_style(style: dict, path: ErrorPath, errors: list, file: str):
+    """Validate contour options."""
+    if "contour" in style:
+        validate_contour(style["contour"], path + ("contour",), errors, file)
+
+
+def _check_wind_style(style: dict, path: ErrorPath, errors: list, file: str):
+    """Validate wind_barbs/wind_arrows options."""
+    if "wind" in style:
+        validate_wind(style["wind"], path + ("wind",), errors, file)
+
+    if "color_by_speed" in style:
+        validate_color_by_speed(
+            style["color_by_speed"], path + ("color_by_speed",), errors, file
+        )
+
+
+# Type-specific checks, keyed by style type (same keys as VALID_STYLE_TYPES)
+_STYLE_TYPE_CHECKS = {
+    "gradient": _check_gradient_style,
+    "filled_contour": _check_gradient_style,
+    "contour": _check_contour_style,
+    "wind_barbs": _check_wind_style,
+    "wind_arrows": _check_wind_style,
+}
+
+
+def load_json(filepath: Path) -> Any:
+    """Parse a JSON file, letting orjson read large files from an mmap."""
+    with open(filepath, "rb") as f:
+        if orjson is None:
+            return json.loads(f.read())
+        if os.fstat(f.fileno()).st_size < MMAP_MIN_BYTES:
+            return orjson.loads(f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # orjson takes a memoryview, not the mmap itself; release the
+            # view before the mapping closes
+            with memoryview(mm) as view:
+                return orjson.loads(view)
 
 
 def validate_file(filepath: Path, verbose: bool = False) -> list:
     """Validate a single style JSON file."""
+    if verbose:
+        print(f"Validating {filepath.name}...")
+    return list(iter_file_errors(filepath))
+
+
+def iter_file_errors(filepath: Path) -> Iterator[ValidationError]:
+    """Yield a style file's validation errors as they are found.
+
+    Errors are flushed after each style, so callers can report them without
+    waiting for the whole file.
+    """
     errors = []
     filename = filepath.name
 
-    if verbose:
-        print(f"Validating {filename}...")
-
     # Read and parse JSON
     try:
-        with open(filepath, "r") as f:
-            data = json.load(f)
+        data = load_json(filepath)
     except json.JSONDecodeError as e:
-        errors.append(ValidationError(filename, "root", f"Invalid JSON: {e}"))
-        return errors
+        _err(errors, filename, ("root",), f"Invalid JSON: {e}")
+        yield from errors
+        return
     except Exception as e:
-        errors.append(ValidationError(filename, "root", f"Could not read file: {e}"))
-        return errors
+        _err(errors, filename, ("root",), f"Could not read file: {e}")
+        yield from errors
+        return
 
     if not isinstance(data, dict):
-        errors.append(
-            ValidationError(
-                filename, "root", f"Root must be object, got {type(data).__name__}"
-            )
+        _err(
+            errors,
+            filename,
+            ("root",),
+            f"Root must be object, got {type(data).__name__}",
         )
-        return errors
+        yield from errors
+        return
 
     # Required: version
     if "version" not in data:
-        errors.append(
-            ValidationError(filename, "root", "Missing required field 'version'")
-        )
+        _err(errors, filename, ("root",), "Missing required field 'version'")
     elif data["version"] != "1.0":
-        errors.append(
-            ValidationError(
-                filename,
-                "version",
-                f"Unknown version '{data['version']}'. Expected '1.0'",
-            )
+        _err(
+            errors,
+            filename,
+            ("version",),
+            f"Unknown version '{data['version']}'. Expected '1.0'",
         )
 
     # Optional: metadata
     if "metadata" in data and not isinstance(data["metadata"], dict):
-        errors.append(ValidationError(filename, "metadata", "Metadata must be object"))
+        _err(errors, filename, ("metadata",), "Metadata must be object")
 
     # Required: styles
     if "styles" not in data:
-        errors.append(
-            ValidationError(filename, "root", "Missing required field 'styles'")
-        )
+        _err(errors, filename, ("root",), "Missing required field 'styles'")
     elif not isinstance(data["styles"], dict):
-        errors.append(
-            ValidationError(
-                filename,
-                "styles",
-                f"Styles must be object, got {type(data['styles']).__name__}",
-            )
+        _err(
+            errors,
+            filename,
+            ("styles",),
+            f"Styles must be object, got {type(data['styles']).__name__}",
         )
     else:
         # Track styles marked as default
         default_styles = []
+        # A schema pass covers every per-style rule except range ordering
+        schema_ok = schema_accepts(data)
 
         # Validate each style
         for style_id, style_def in data["styles"].items():
             # Skip comment keys
             if style_id.startswith("_"):
                 continue
-            validate_style(style_id, style_def, f"styles.{style_id}", errors, filename)
+            if not schema_ok:
+                validate_style(
+                    style_id, style_def, ("styles", style_id), errors, filename
+                )
+            elif "range" in style_def:
+                validate_range(
+                    style_def["range"], ("styles", style_id, "range"), errors, filename
+                )
+            if errors:
+                yield from errors
+                errors.clear()
 
             # Track default styles
             if isinstance(style_def, dict) and style_def.get("default") is True:
@@ -499,26 +828,62 @@ def validate_file(filepath: Path, verbose: bool = False) -> list:
 
         # Check for exactly one default
         if len(default_styles) == 0:
-            errors.append(
-                ValidationError(
-                    filename,
-                    "styles",
-                    "No default style specified. Add 'default: true' to one style.",
-                )
+            _err(
+                errors,
+                filename,
+                ("styles",),
+                "No default style specified. Add 'default: true' to one style.",
             )
         elif len(default_styles) > 1:
-            errors.append(
-                ValidationError(
-                    filename,
-                    "styles",
-                    f"Multiple default styles found: {default_styles}. Only one style should have 'default: true'.",
-                )
+            _err(
+                errors,
+                filename,
+                ("styles",),
+                f"Multiple default styles found: {default_styles}. Only one style should have 'default: true'.",
             )
 
-    return errors
+    yield from errors
+
+
+def read_clean_cache(cache_path: Path, validator_digest: str) -> dict:
+    """Return {filename: sha256} for files that last validated clean.
+
+    Entries written by a different version of this script are discarded.
+    """
+    try:
+        cache = json.loads(cache_path.read_bytes())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict) or cache.get("validator") != validator_digest:
+        return {}
+    files = cache.get("files")
+    return files if isinstance(files, dict) else {}
+
+
+def write_clean_cache(cache_path: Path, validator_digest: str, clean: dict):
+    """Record the content hashes of files that validated clean."""
+    try:
+        cache_path.parent.mkdir(exist_ok=True)
+        tmp = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps({"validator": validator_digest, "files": clean}))
+        os.replace(tmp, cache_path)
+    except OSError:
+        pass
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Validate style JSON files")
+    parser.add_argument(
+        "--verbose", action="store_true", help="Accepted for compatibility"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-validate files unchanged since their last clean run "
+        f"(hashes are kept in {CACHE_DIR_NAME}/)",
+    )
+    args = parser.parse_args()
+
     # Always verbose to show any warnings
     verbose = True
 
@@ -527,9 +892,17 @@ def main():
     styles_dir = script_dir
 
     # Get all JSON files except schema.example.json
-    json_files = sorted(
-        [f for f in styles_dir.glob("*.json") if f.name != "schema.example.json"]
-    )
+    with os.scandir(styles_dir) as entries:
+        json_files = [
+            Path(path)
+            for path in sorted(
+                e.path
+                for e in entries
+                if e.name.endswith(".json")
+                and e.name != "schema.example.json"
+                and e.is_file()
+            )
+        ]
 
     if not json_files:
         print("No style JSON files found!")
@@ -537,30 +910,69 @@ def main():
 
     print(f"Validating {len(json_files)} style files...\n")
 
-    all_errors = []
+    total_errors = 0
     files_with_errors = 0
 
-    for filepath in json_files:
-        errors = validate_file(filepath, verbose)
-        if errors:
-            files_with_errors += 1
-            all_errors.extend(errors)
-            if verbose:
-                for err in errors:
-                    print(f"  ERROR: {err.path}: {err.message}")
+    # Files whose content hash matches their last clean run are skipped.
+    # The script's own hash is part of the key so rule changes re-check all.
+    cache_path = styles_dir / CACHE_DIR_NAME / CLEAN_CACHE_NAME
+    validator_digest = hashlib.sha256(Path(__file__).read_bytes()).hexdigest()
+    clean = {} if args.no_cache else read_clean_cache(cache_path, validator_digest)
+    digests = {}
+    for f in json_files:
+        try:
+            digests[f] = hashlib.sha256(f.read_bytes()).hexdigest()
+        except OSError:
+            digests[f] = None  # validate_file reports the read error
+    to_validate = [
+        f for f in json_files if digests[f] is None or clean.get(f.name) != digests[f]
+    ]
+
+    # Files are independent, so validate larger batches across processes.
+    # Results come back in input order; serial runs report each error as
+    # soon as it is found.
+    parallel = len(to_validate) >= PARALLEL_MIN_FILES
+    pending = set(to_validate)
+    clean = {}
+    if to_validate:
+        load_schema()
+    pool = ProcessPoolExecutor(initializer=load_schema) if parallel else nullcontext()
+    with pool as executor:
+        if parallel:
+            results = executor.map(validate_file, to_validate, repeat(False))
+        else:
+            results = map(iter_file_errors, to_validate)
+
+        for filepath in json_files:
+            # Each file's lines are written at once as its results arrive;
+            # only the error counts are kept
+            lines = [f"Validating {filepath.name}..."] if verbose else []
+            file_errors = 0
+            if filepath in pending:
+                for err in next(results):
+                    file_errors += 1
+                    lines.append(f"  ERROR: {err.path}: {err.message}")
+            if lines:
+                sys.stdout.write("\n".join(lines) + "\n")
+            if file_errors:
+                files_with_errors += 1
+                total_errors += file_errors
+            elif digests[filepath] is not None:
+                clean[filepath.name] = digests[filepath]
+
+    if not args.no_cache:
+        write_clean_cache(cache_path, validator_digest, clean)
 
     # Print summary
     print("-" * 60)
-    if all_errors:
-        print(f"\nFOUND {len(all_errors)} ERROR(S) in {files_with_errors} file(s):\n")
-        for err in all_errors:
-            print(f"  {err}")
-        print()
+    if total_errors:
+        print(f"\nFOUND {total_errors} ERROR(S) in {files_with_errors} file(s)\n")
         sys.exit(1)
     else:
-        print(f"\nSUCCESS: All {len(json_files)} files are valid!")
-        for f in json_files:
-            print(f"  {f.name}")
+        buf = [f"\nSUCCESS: All {len(json_files)} files are valid!"]
+        buf.extend(f"  {f.name}" for f in json_files)
+        buf.append("")
+        sys.stdout.write("\n".join(buf))
         sys.exit(0)
 
 
@@ -15,22 +15,249 @@ Options:
     --location ID       Location ID for locations queries (default: first available)
     --limit N           Max queries per collection (default: unlimited)
     --format FMT        Output format: covjson, geojson, both (default: both)
+    --concurrency N     Max in-flight HTTP requests (default: 20)
+    --cache-dir DIR     Where metadata ETags are kept between runs
+                        (default: ~/.cache/edr-product-dump/<endpoint>)
 """
 
 import argparse
+import asyncio
+import hashlib
+import importlib.util
 import json
 import os
+import random
 import sys
-from datetime import datetime
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import partial
 from pathlib import Path
 from typing import Any, Optional
 from urllib.parse import quote, urljoin
 
 try:
-    import requests
+    import httpx
 except ImportError:
-    print("ERROR: requests library required. Install with: pip install requests")
-    sys.exit(1)
+    httpx = None
+    # Fall back to a pooled requests.Session driven from worker threads
+    try:
+        import requests
+        from requests.adapters import HTTPAdapter
+    except ImportError:
+        print("ERROR: httpx library required. Install with: pip install 'httpx[http2]'")
+        sys.exit(1)
+
+# Connection failures and timeouts worth retrying
+if httpx is not None:
+    TRANSIENT_ERRORS = (httpx.TransportError,)
+else:
+    TRANSIENT_ERRORS = (requests.ConnectionError, requests.Timeout)
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# With h2 installed, all queries are multiplexed over one connection
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+METADATA_TIMEOUT = 30.0
+QUERY_TIMEOUT = 60.0
+
+# Per-query results are appended here as they finish
+RESULTS_LOG_NAME = "results.jsonl"
+
+# The same results grouped by collection, for the index page
+RESULTS_BY_COLLECTION_NAME = "results_by_collection.json"
+
+# Retry transient failures with jittered exponential backoff
+RETRY_ATTEMPTS = 3
+RETRY_BASE_DELAY = 0.5
+RETRY_MAX_DELAY = 8.0
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+# Upper bound on how long a server's Retry-After can make us wait
+RETRY_AFTER_MAX = 60.0
+
+# Metadata documents and their ETags are kept here between runs, one
+# directory per endpoint, so runs into fresh output directories revalidate
+DEFAULT_CACHE_ROOT = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "edr-product-dump"
+)
+
+# Product responses are streamed to disk in chunks of this size; each chunk
+# is one hop to a worker thread, so most responses take a single write
+STREAM_CHUNK_SIZE = 1024 * 1024
+
+
+def loads_json(raw: bytes) -> Any:
+    """Parse a JSON document, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def dumps_line(data: Any) -> bytes:
+    """Serialize data as one newline-terminated JSON Lines record."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_APPEND_NEWLINE)
+    return json.dumps(data).encode() + b"\n"
+
+
+def write_json(path: Path, data: Any, pretty: bool = True):
+    """Write data to path as JSON, indented unless pretty is False.
+
+    Files people read (metadata, results.json) stay indented; files only the
+    index page parses are written compact.
+    """
+    if orjson is not None:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0))
+        return
+    with open(path, "w") as f:
+        if pretty:
+            json.dump(data, f, indent=2)
+        else:
+            json.dump(data, f, separators=(",", ":"))
+
+
+def write_bytes(path: Path, body: bytes):
+    """Write a raw response body to path."""
+    with open(path, "wb") as f:
+        f.write(body)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Return a Retry-After header (seconds or HTTP date) as seconds, or None."""
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return (when - datetime.now(timezone.utc)).total_seconds()
+
+
+def retry_delay(attempt: int, retry_after: Optional[str] = None) -> float:
+    """Return the seconds to wait after failed attempt number `attempt`.
+
+    The server's Retry-After wins when present; otherwise use full-jitter
+    exponential backoff capped at RETRY_MAX_DELAY.
+    """
+    delay = parse_retry_after(retry_after)
+    if delay is not None:
+        return min(max(delay, 0.0), RETRY_AFTER_MAX)
+    return random.uniform(0, min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2**attempt))
+
+
+def count_covjson_values(path: Path, param: str) -> tuple[int, int]:
+    """Return (value_count, non_null_count) for a saved CoverageJSON file."""
+    with open(path, "rb") as f:
+        # ijson prefixes are dot-separated, so a dotted name needs a full parse
+        if ijson is not None and "." not in param:
+            # Walk just the parameter's values without building the document
+            value_count = non_null = 0
+            for value in ijson.items(f, f"ranges.{param}.values.item"):
+                value_count += 1
+                non_null += value is not None
+            return value_count, non_null
+        data = loads_json(f.read())
+    values = data.get("ranges", {}).get(param, {}).get("values", [])
+    # list.count runs in C and builds no filtered copy of the values
+    return len(values), len(values) - values.count(None)
+
+
+def count_geojson_features(path: Path) -> int:
+    """Return the number of features in a saved GeoJSON file."""
+    with open(path, "rb") as f:
+        if ijson is not None:
+            return sum(1 for _ in ijson.items(f, "features.item"))
+        data = loads_json(f.read())
+    return len(data.get("features", []))
+
+
+class ThreadedResponse:
+    """Streaming requests.Response with the httpx async methods used here."""
+
+    def __init__(self, resp: "requests.Response", executor: ThreadPoolExecutor):
+        self._resp = resp
+        self._executor = executor
+        self.status_code = resp.status_code
+        self.headers = resp.headers
+
+    @property
+    def content(self) -> bytes:
+        return self._resp.content
+
+    async def aread(self) -> bytes:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, lambda: self._resp.content)
+
+    async def aiter_bytes(self, chunk_size: int):
+        loop = asyncio.get_running_loop()
+        chunks = self._resp.iter_content(chunk_size)
+        while True:
+            chunk = await loop.run_in_executor(self._executor, next, chunks, None)
+            if chunk is None:
+                return
+            yield chunk
+
+
+class ThreadedRequestsClient:
+    """Stand-in for httpx.AsyncClient when httpx is not installed.
+
+    Requests share one requests.Session, so connections are pooled and kept
+    alive, and run on a dedicated thread pool sized to the concurrency limit.
+    """
+
+    def __init__(self, pool_size: int, timeout: float):
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.session.headers["Connection"] = "keep-alive"
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self._executor = ThreadPoolExecutor(max_workers=pool_size)
+
+    async def __aenter__(self) -> "ThreadedRequestsClient":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self._executor.shutdown()
+        self.session.close()
+
+    async def get(
+        self, url: str, headers: Optional[dict] = None, timeout: Optional[float] = None
+    ) -> "requests.Response":
+        call = partial(
+            self.session.get, url, headers=headers, timeout=timeout or self.timeout
+        )
+        return await asyncio.get_running_loop().run_in_executor(self._executor, call)
+
+    @asynccontextmanager
+    async def stream(self, method: str, url: str):
+        call = partial(
+            self.session.request, method, url, stream=True, timeout=self.timeout
+        )
+        resp = await asyncio.get_running_loop().run_in_executor(self._executor, call)
+        try:
+            yield ThreadedResponse(resp, self._executor)
+        finally:
+            resp.close()
 
 
 class EDRProductDumper:
@@ -42,17 +269,42 @@ class EDRProductDumper:
         location_id: Optional[str] = None,
         limit: Optional[int] = None,
         output_format: str = "both",
+        concurrency: int = 20,
+        cache_dir: Optional[str] = None,
     ):
         self.endpoint = endpoint.rstrip("/")
         self.output_dir = Path(output_dir)
+        if cache_dir is None:
+            self.cache_dir = DEFAULT_CACHE_ROOT / quote(self.endpoint, safe="")
+        else:
+            self.cache_dir = Path(cache_dir)
         self.query_type = query_type
         self.location_id = location_id
         self.limit = limit
         self.output_format = output_format
+        self.concurrency = concurrency
+
+        # Created in _run_async(); the semaphore caps in-flight requests
+        # httpx.AsyncClient, or ThreadedRequestsClient without httpx
+        self.client = None
+        self._sem: Optional[asyncio.Semaphore] = None
+
+        # Metadata URL -> ETag, persisted in cache_dir/etags.json alongside
+        # the documents so later runs can revalidate instead of refetching
+        self.etags: dict[str, str] = {}
 
         # Test coordinates (center of CONUS)
         self.test_point = {"lon": -100, "lat": 40}
 
+        # URL-encoded WKT coords, built once rather than on every query
+        lon, lat = self.test_point["lon"], self.test_point["lat"]
+        self._point_coords = quote(f"POINT({lon} {lat})")
+        # 1x1 degree box
+        self._polygon_coords = quote(
+            f"POLYGON(({lon - 0.5} {lat - 0.5},{lon + 0.5} {lat - 0.5},"
+            f"{lon + 0.5} {lat + 0.5},{lon - 0.5} {lat + 0.5},{lon - 0.5} {lat - 0.5}))"
+        )
+
         # Stats
         self.stats = {
             "total": 0,
@@ -62,8 +314,8 @@ class EDRProductDumper:
             "errors": [],
         }
 
-        # Collected results for summary
-        self.results = []
+        # Open in run(); one JSON line per finished query
+        self._results_fp = None
 
     def run(self):
         """Main entry point."""
@@ -72,6 +324,7 @@ class EDRProductDumper:
         print("=" * 60)
         print(f"Endpoint:    {self.endpoint}")
         print(f"Output:      {self.output_dir}")
+        print(f"Cache:       {self.cache_dir}")
         print(f"Query type:  {self.query_type}")
         print(f"Format:      {self.output_format}")
         print()
@@ -81,20 +334,18 @@ class EDRProductDumper:
         (self.output_dir / "covjson").mkdir(exist_ok=True)
         (self.output_dir / "geojson").mkdir(exist_ok=True)
         (self.output_dir / "metadata").mkdir(exist_ok=True)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
 
-        # Fetch collections
-        collections = self.fetch_collections()
-        if not collections:
-            print("ERROR: No collections found")
+        self.load_etags()
+        # Results go to disk as queries finish rather than piling up in memory,
+        # so a killed run still leaves everything completed so far
+        with open(self.output_dir / RESULTS_LOG_NAME, "wb") as results_fp:
+            self._results_fp = results_fp
+            found = asyncio.run(self._run_async())
+        self.save_etags()
+        if not found:
             return
 
-        print(f"Found {len(collections)} collections")
-        print()
-
-        # Process each collection
-        for coll in collections:
-            self.process_collection(coll)
-
         # Write summary
         self.write_summary()
         self.write_index_html()
@@ -112,46 +363,189 @@ class EDRProductDumper:
         print(f"Results saved to: {self.output_dir}")
         print(f"View results: python3 -m http.server -d {self.output_dir} 8000")
 
-    def fetch_collections(self) -> list:
+    async def _run_async(self) -> bool:
+        """Fetch collections and query their products concurrently.
+
+        Returns False if there was nothing to query.
+        """
+        self._sem = asyncio.Semaphore(self.concurrency)
+        if httpx is not None:
+            limits = httpx.Limits(
+                max_connections=self.concurrency,
+                max_keepalive_connections=self.concurrency,
+                keepalive_expiry=60,
+            )
+            client = httpx.AsyncClient(
+                http2=HTTP2_AVAILABLE, limits=limits, timeout=QUERY_TIMEOUT
+            )
+        else:
+            client = ThreadedRequestsClient(self.concurrency, QUERY_TIMEOUT)
+
+        async with client:
+            self.client = client
+
+            # Fetch collections
+            collections = await self.fetch_collections()
+            if not collections:
+                print("ERROR: No collections found")
+                return False
+
+            print(f"Found {len(collections)} collections")
+            print()
+
+            # Fetch every collection's details up front, concurrently
+            coll_ids = [coll.get("id", "unknown") for coll in collections]
+            details = await asyncio.gather(
+                *(self.fetch_collection_detail(coll_id) for coll_id in coll_ids),
+                return_exceptions=True,
+            )
+
+            # Collections are independent, so process them all at once; the
+            # shared semaphore still caps the requests in flight
+            await asyncio.gather(
+                *(
+                    self.process_collection(coll_id, detail, coll_index)
+                    for coll_index, (coll_id, detail) in enumerate(
+                        zip(coll_ids, details)
+                    )
+                )
+            )
+
+        return True
+
+    def load_etags(self):
+        """Load ETags saved by a previous run against this endpoint."""
+        etags_file = self.cache_dir / "etags.json"
+        if etags_file.exists():
+            try:
+                self.etags = loads_json(etags_file.read_bytes())
+            except ValueError:
+                self.etags = {}
+
+    def save_etags(self):
+        """Persist ETags for the metadata documents fetched this run."""
+        write_json(self.cache_dir / "etags.json", self.etags)
+
+    def cached_copy(self, url: str) -> Path:
+        """Return where the last response body for url is kept."""
+        digest = hashlib.sha256(url.encode()).hexdigest()[:16]
+        return self.cache_dir / f"{digest}.json"
+
+    async def get_json(self, url: str, cache_file: Optional[Path] = None) -> Any:
+        """GET a metadata document and parse it as JSON.
+
+        With cache_file, the document is saved there. A copy is also kept in
+        cache_dir and revalidated on later runs with If-None-Match; a 304
+        reloads that copy.
+        """
+        headers = {}
+        cached = self.cached_copy(url)
+        if cache_file is not None and url in self.etags and cached.exists():
+            headers["If-None-Match"] = self.etags[url]
+
+        resp = await self.with_retries(
+            partial(self.client.get, url, headers=headers, timeout=METADATA_TIMEOUT)
+        )
+
+        if resp.status_code == 304 and headers:
+            raw = await asyncio.to_thread(cached.read_bytes)
+            data = loads_json(raw)
+            await asyncio.to_thread(write_json, cache_file, data)
+            return data
+
+        resp.raise_for_status()
+        raw = resp.content
+        data = loads_json(raw)
+        if cache_file is not None:
+            # File I/O runs off the event loop thread
+            await asyncio.to_thread(write_json, cache_file, data)
+            etag = resp.headers.get("ETag")
+            if etag:
+                await asyncio.to_thread(write_bytes, cached, raw)
+                self.etags[url] = etag
+            else:
+                self.etags.pop(url, None)
+        return data
+
+    async def with_retries(self, send):
+        """Await send() under the request semaphore and return its response.
+
+        Connection errors, timeouts and 429/502/503/504 responses are retried
+        up to RETRY_ATTEMPTS times in all. The backoff sleep happens outside
+        the semaphore, so waiting retries don't hold a request slot.
+        """
+        for attempt in range(1, RETRY_ATTEMPTS + 1):
+            try:
+                async with self._sem:
+                    resp = await send()
+            except TRANSIENT_ERRORS:
+                if attempt == RETRY_ATTEMPTS:
+                    raise
+                delay = retry_delay(attempt)
+            else:
+                if resp.status_code not in RETRY_STATUSES or attempt == RETRY_ATTEMPTS:
+                    return resp
+                delay = retry_delay(attempt, resp.headers.get("Retry-After"))
+            await asyncio.sleep(delay)
+
+    async def download(self, url: str, output_file: Path):
+        """GET url, streaming a 200 body to output_file; return the response."""
+        async with self.client.stream("GET", url) as resp:
+            if resp.status_code == 200:
+                # Save the body as served rather than parsing and
+                # re-serializing it, writing from a worker thread
+                f = await asyncio.to_thread(open, output_file, "wb")
+                try:
+                    async for chunk in resp.aiter_bytes(STREAM_CHUNK_SIZE):
+                        await asyncio.to_thread(f.write, chunk)
+                finally:
+                    await asyncio.to_thread(f.close)
+            else:
+                await resp.aread()
+        return resp
+
+    async def fetch_collections(self) -> list:
         """Fetch list of collections from API."""
         try:
-            resp = requests.get(f"{self.endpoint}/collections", timeout=30)
-            resp.raise_for_status()
-            data = resp.json()
-
-            # Save to metadata
-            with open(self.output_dir / "metadata" / "collections.json", "w") as f:
-                json.dump(data, f, indent=2)
+            data = await self.get_json(
+                f"{self.endpoint}/collections",
+                cache_file=self.output_dir / "metadata" / "collections.json",
+            )
 
             return data.get("collections", [])
         except Exception as e:
             print(f"ERROR fetching collections: {e}")
             return []
 
-    def process_collection(self, coll: dict):
-        """Process a single collection."""
-        coll_id = coll.get("id", "unknown")
-        print()
-        print(f"Processing: {coll_id}")
-        print("-" * 40)
+    async def fetch_collection_detail(self, coll_id: str) -> Any:
+        """Fetch a collection's full details, saving them to metadata."""
+        return await self.get_json(
+            f"{self.endpoint}/collections/{coll_id}",
+            cache_file=self.output_dir / "metadata" / f"{coll_id}.json",
+        )
 
-        # Fetch full collection details
-        try:
-            resp = requests.get(f"{self.endpoint}/collections/{coll_id}", timeout=30)
-            resp.raise_for_status()
-            coll_detail = resp.json()
+    async def process_collection(
+        self, coll_id: str, coll_detail: Any, coll_index: int = 0
+    ):
+        """Process a single collection given its fetched details.
 
-            # Save metadata
-            with open(self.output_dir / "metadata" / f"{coll_id}.json", "w") as f:
-                json.dump(coll_detail, f, indent=2)
-        except Exception as e:
-            print(f"  ERROR fetching collection details: {e}")
+        coll_detail is the exception instead if fetching the details failed.
+        Collections run concurrently, so the header is printed as one block
+        and each query line is prefixed with the collection ID. coll_index is
+        the collection's position in the listing, used to order results.
+        """
+        header = ["", f"Processing: {coll_id}", "-" * 40]
+
+        if isinstance(coll_detail, Exception):
+            header.append(f"  ERROR fetching collection details: {coll_detail}")
+            print("\n".join(header))
             return
 
         # Extract parameters
         params = list(coll_detail.get("parameter_names", {}).keys())
         if not params:
-            print("  No parameters found, skipping")
+            header.append("  No parameters found, skipping")
+            print("\n".join(header))
             return
 
         # Extract levels
@@ -166,9 +560,10 @@ class EDRProductDumper:
         times = coll_detail.get("extent", {}).get("temporal", {}).get("values", [])
         latest_time = times[0] if times else None
 
-        print(f"  Parameters: {len(params)}")
-        print(f"  Levels: {len(levels) if levels else 'none'}")
-        print(f"  Latest time: {latest_time or 'none'}")
+        header.append(f"  Parameters: {len(params)}")
+        header.append(f"  Levels: {len(levels) if levels else 'none'}")
+        header.append(f"  Latest time: {latest_time or 'none'}")
+        print("\n".join(header))
 
         # Create output directories
         (self.output_dir / "covjson" / coll_id).mkdir(exist_ok=True)
@@ -177,32 +572,42 @@ class EDRProductDumper:
         # If using locations query, fetch available locations
         location_id = self.location_id
         if self.query_type == "locations" and not location_id:
-            location_id = self.fetch_first_location(coll_id)
+            location_id = await self.fetch_first_location(coll_id)
             if not location_id:
-                print("  No locations available, skipping")
+                print(f"  {coll_id}: No locations available, skipping")
                 return
 
-        # Query each parameter/level combination
-        query_count = 0
-        for param in params:
-            level_list = levels if levels else [None]
+        # Query every parameter/level combination concurrently
+        combos = [(param, level) for param in params for level in levels or [None]]
+        if self.limit and len(combos) > self.limit:
+            combos = combos[: self.limit]
+            reached_limit = True
+        else:
+            reached_limit = False
 
-            for level in level_list:
-                if self.limit and query_count >= self.limit:
-                    print(f"  Reached limit of {self.limit} queries")
-                    return
+        await asyncio.gather(
+            *(
+                self.query_product(
+                    coll_id,
+                    param,
+                    level,
+                    latest_time,
+                    location_id,
+                    query_index=[coll_index, i],
+                )
+                for i, (param, level) in enumerate(combos)
+            )
+        )
 
-                self.query_product(coll_id, param, level, latest_time, location_id)
-                query_count += 1
+        if reached_limit:
+            print(f"  {coll_id}: Reached limit of {self.limit} queries")
 
-    def fetch_first_location(self, coll_id: str) -> Optional[str]:
+    async def fetch_first_location(self, coll_id: str) -> Optional[str]:
         """Fetch the first available location for a collection."""
         try:
-            resp = requests.get(
-                f"{self.endpoint}/collections/{coll_id}/locations", timeout=30
+            data = await self.get_json(
+                f"{self.endpoint}/collections/{coll_id}/locations"
             )
-            resp.raise_for_status()
-            data = resp.json()
             features = data.get("features", [])
             if features:
                 # Extract location ID from URI if needed
@@ -211,18 +616,24 @@ class EDRProductDumper:
                     return raw_id.split("/locations/")[-1]
                 return raw_id
         except Exception as e:
-            print(f"  Warning: Could not fetch locations: {e}")
+            print(f"  {coll_id}: Warning: Could not fetch locations: {e}")
         return None
 
-    def query_product(
+    async def query_product(
         self,
         coll_id: str,
         param: str,
         level: Optional[float],
         time: Optional[str],
         location_id: Optional[str] = None,
+        query_index: Optional[list] = None,
     ):
-        """Query a single product and save results."""
+        """Query a single product, save the responses and record its result.
+
+        query_index ([collection position, query position]) is recorded with
+        the result so the summaries can list results in query order rather
+        than the order they finished in.
+        """
         self.stats["total"] += 1
 
         # Build filename
@@ -235,24 +646,17 @@ class EDRProductDumper:
         if self.query_type == "locations" and location_id:
             base_url = f"{self.endpoint}/collections/{coll_id}/locations/{location_id}"
         elif self.query_type == "area":
-            # 1x1 degree box
-            lon, lat = self.test_point["lon"], self.test_point["lat"]
-            polygon = f"POLYGON(({lon - 0.5} {lat - 0.5},{lon + 0.5} {lat - 0.5},{lon + 0.5} {lat + 0.5},{lon - 0.5} {lat + 0.5},{lon - 0.5} {lat - 0.5}))"
             base_url = f"{self.endpoint}/collections/{coll_id}/area"
         else:
-            coords = f"POINT({self.test_point['lon']} {self.test_point['lat']})"
             base_url = f"{self.endpoint}/collections/{coll_id}/position"
 
         # Build query params
         query_params = [f"parameter-name={param}"]
 
         if self.query_type == "position":
-            coords = f"POINT({self.test_point['lon']} {self.test_point['lat']})"
-            query_params.append(f"coords={quote(coords)}")
+            query_params.append(f"coords={self._point_coords}")
         elif self.query_type == "area":
-            lon, lat = self.test_point["lon"], self.test_point["lat"]
-            polygon = f"POLYGON(({lon - 0.5} {lat - 0.5},{lon + 0.5} {lat - 0.5},{lon + 0.5} {lat + 0.5},{lon - 0.5} {lat + 0.5},{lon - 0.5} {lat - 0.5}))"
-            query_params.append(f"coords={quote(polygon)}")
+            query_params.append(f"coords={self._polygon_coords}")
 
         if level is not None:
             query_params.append(f"z={level}")
@@ -260,12 +664,12 @@ class EDRProductDumper:
         if time:
             query_params.append(f"datetime={quote(time)}")
 
-        # Print progress
-        level_str = f" @ z={level}" if level is not None else ""
-        print(f"  {param}{level_str}...", end=" ", flush=True)
+        # Shared by every format; each only appends its own suffix
+        query_url = f"{base_url}?{'&'.join(query_params)}"
 
         # Query CoverageJSON
         result = {
+            "query_index": query_index,
             "collection": coll_id,
             "parameter": param,
             "level": level,
@@ -280,23 +684,22 @@ class EDRProductDumper:
             formats_to_query.append(("geojson", "&f=geojson"))
 
         for fmt, fmt_param in formats_to_query:
-            url = f"{base_url}?{'&'.join(query_params)}{fmt_param}"
+            url = query_url + fmt_param
             result[f"{fmt}_url"] = url
 
             try:
-                resp = requests.get(url, timeout=60)
                 output_file = self.output_dir / fmt / coll_id / f"{filename}.json"
+                resp = await self.with_retries(
+                    partial(self.download, url, output_file)
+                )
 
                 if resp.status_code == 200:
-                    data = resp.json()
-                    with open(output_file, "w") as f:
-                        json.dump(data, f, indent=2)
-
                     # Check for actual data
                     if fmt == "covjson":
-                        values = data.get("ranges", {}).get(param, {}).get("values", [])
-                        non_null = len([v for v in values if v is not None])
-                        result["value_count"] = len(values)
+                        value_count, non_null = await asyncio.to_thread(
+                            count_covjson_values, output_file, param
+                        )
+                        result["value_count"] = value_count
                         result["non_null_count"] = non_null
 
                         if non_null > 0:
@@ -305,33 +708,41 @@ class EDRProductDumper:
                             result["status"] = "empty"
                     else:
                         # GeoJSON
-                        features = data.get("features", [])
-                        result["feature_count"] = len(features)
+                        result["feature_count"] = await asyncio.to_thread(
+                            count_geojson_features, output_file
+                        )
                 else:
                     result["status"] = "failed"
                     result["error"] = f"HTTP {resp.status_code}"
-                    with open(output_file, "w") as f:
-                        f.write(resp.text)
+                    # Keep the error body exactly as served; no decode needed
+                    await asyncio.to_thread(write_bytes, output_file, resp.content)
 
             except Exception as e:
+                # Timeouts carry no message
+                error = str(e) or type(e).__name__
                 result["status"] = "failed"
-                result["error"] = str(e)
+                result["error"] = error
                 self.stats["errors"].append(
-                    {"collection": coll_id, "param": param, "error": str(e)}
+                    {"collection": coll_id, "param": param, "error": error}
                 )
 
-        # Update stats and print result
+        # Update stats and print the whole line at once, since queries
+        # finish in any order
+        level_str = f" @ z={level}" if level is not None else ""
         if result["status"] == "success":
             self.stats["success"] += 1
-            print(f"OK ({result.get('non_null_count', '?')} values)")
+            outcome = f"OK ({result.get('non_null_count', '?')} values)"
         elif result["status"] == "empty":
             self.stats["empty"] += 1
-            print("EMPTY")
+            outcome = "EMPTY"
         else:
             self.stats["failed"] += 1
-            print(f"FAILED: {result.get('error', 'unknown')}")
+            outcome = f"FAILED: {result.get('error', 'unknown')}"
+        print(f"  {coll_id}/{param}{level_str}... {outcome}")
 
-        self.results.append(result)
+        # Flushed per record so a killed run leaves every finished query
+        self._results_fp.write(dumps_line(result))
+        self._results_fp.flush()
 
     def write_summary(self):
         """Write summary files."""
@@ -353,19 +764,62 @@ class EDRProductDumper:
                 for err in self.stats["errors"][:20]:  # First 20 errors
                     f.write(f"  {err['collection']}/{err['param']}: {err['error']}\n")
 
-        # JSON results
-        with open(self.output_dir / "results.json", "w") as f:
-            json.dump(
-                {
-                    "endpoint": self.endpoint,
-                    "timestamp": datetime.now().isoformat(),
-                    "query_type": self.query_type,
-                    "stats": self.stats,
-                    "results": self.results,
-                },
-                f,
-                indent=2,
-            )
+        # JSON results; per-query details are already in the results log
+        write_json(
+            self.output_dir / "results.json",
+            {
+                "endpoint": self.endpoint,
+                "timestamp": datetime.now().isoformat(),
+                "query_type": self.query_type,
+                "stats": self.stats,
+                "results_file": RESULTS_LOG_NAME,
+            },
+        )
+
+        # Group once here so the index page doesn't have to on every load
+        self.write_results_by_collection()
+
+    def write_results_by_collection(self):
+        """Write the results log grouped by collection, in query order.
+
+        Only each record's query_index and place in the log are held in
+        memory; the records themselves are copied from the log in order, so
+        collections follow the listing and each one's rows follow its queries.
+        """
+        log_path = self.output_dir / RESULTS_LOG_NAME
+        entries = []
+        with open(log_path, "rb") as log:
+            offset = 0
+            for line in log:
+                result = loads_json(line)
+                query_index = result["query_index"] or []
+                # The length leaves out the record's trailing newline
+                entries.append(
+                    (query_index, offset, len(line) - 1, result["collection"])
+                )
+                offset += len(line)
+        entries.sort()
+
+        groups = defaultdict(list)
+        for _, offset, length, coll_id in entries:
+            groups[coll_id].append((offset, length))
+        del entries
+
+        with open(log_path, "rb") as log, open(
+            self.output_dir / RESULTS_BY_COLLECTION_NAME, "wb"
+        ) as out:
+            out.write(b"{")
+            for i, (coll_id, spans) in enumerate(groups.items()):
+                if i:
+                    out.write(b",")
+                out.write(dumps_line(coll_id).rstrip(b"\n") + b":[")
+                for j, (offset, length) in enumerate(spans):
+                    if j:
+                        out.write(b",")
+                    log.seek(offset)
+                    out.write(log.read(length))
+                out.write(b"]")
+            out.write(b"}")
 
     def write_index_html(self):
         """Write an HTML index for viewing results."""
@@ -396,19 +850,29 @@ class EDRProductDumper:
         .stat.empty .stat-value { color: #fbbf24; }
         .stat.failed .stat-value { color: #f87171; }
         
-        .collection { 
-            margin: 20px 0; padding: 20px;
-            background: #1e293b; border-radius: 8px;
+        /* Results are virtualized: only rows in view are in the DOM */
+        .results-header {
+            margin-top: 20px; color: #94a3b8;
+            background: #1e293b; border-radius: 8px 8px 0 0;
         }
-        .collection h3 { margin-top: 0; color: #38bdf8; }
-        
-        .results-table { width: 100%; border-collapse: collapse; margin-top: 15px; }
-        .results-table th, .results-table td { 
-            padding: 8px 12px; text-align: left;
+        .results-scroll {
+            height: calc(100vh - 300px); min-height: 300px; overflow-y: auto;
+            background: #1e293b; border-radius: 0 0 8px 8px;
+        }
+        #spacer { position: relative; }
+        #rows { position: absolute; top: 0; left: 0; right: 0; }
+        .row {
+            display: grid; grid-template-columns: 2fr 1fr 1fr 1fr 1.5fr; gap: 12px;
+            align-items: center; height: 32px; padding: 0 12px;
             border-bottom: 1px solid #334155;
+            white-space: nowrap; overflow: hidden;
         }
-        .results-table th { color: #94a3b8; font-weight: normal; }
-        .results-table tr:hover { background: #334155; }
+        #rows .row:hover { background: #334155; }
+        .row.collection-row {
+            display: block; line-height: 32px;
+            background: #0f172a; color: #38bdf8; font-weight: bold;
+        }
+        .collection-row .count { color: #94a3b8; font-weight: normal; }
         
         .status { padding: 2px 8px; border-radius: 4px; font-size: 0.85em; }
         .status.success { background: #166534; color: #4ade80; }
@@ -456,7 +920,12 @@ class EDRProductDumper:
             <div class="stat failed"><div class="stat-value" id="failed">-</div><div class="stat-label">Failed</div></div>
         </div>
         
-        <div id="collections"></div>
+        <div class="row results-header">
+            <span>Parameter</span><span>Level</span><span>Status</span><span>Values</span><span>Files</span>
+        </div>
+        <div id="collections" class="results-scroll">
+            <div id="spacer"><div id="rows"></div></div>
+        </div>
     </div>
     
     <div class="viewer">
@@ -472,6 +941,59 @@ class EDRProductDumper:
     <script>
         let resultsData = null;
         
+        // Flattened collection headers and result rows, all ROW_HEIGHT tall
+        const ROW_HEIGHT = 32;
+        const OVERSCAN = 10;
+        let rows = [];
+        let renderScheduled = false;
+        
+        function escapeHtml(value) {
+            const entities = { '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;' };
+            return String(value).replace(/[&<>"']/g, c => entities[c]);
+        }
+        
+        function renderRow(row) {
+            if (row.collection) {
+                return `<div class="row collection-row">${escapeHtml(row.collection)} ` +
+                    `<span class="count">${row.count} queries</span></div>`;
+            }
+            const r = row.result;
+            const levelStr = r.level !== null ? r.level : '-';
+            const valuesStr = r.non_null_count !== undefined 
+                ? `${r.non_null_count}/${r.value_count}` 
+                : '-';
+            const filename = r.level !== null ? `${r.parameter}_z${r.level}` : r.parameter;
+            const link = (fmt, label) =>
+                `<a href="#" data-path="${escapeHtml(`${fmt}/${r.collection}/${filename}.json`)}" ` +
+                `data-title="${escapeHtml(`${r.parameter} ${label}`)}">${fmt}</a>`;
+            return `<div class="row">` +
+                `<span>${escapeHtml(r.parameter)}</span>` +
+                `<span>${levelStr}</span>` +
+                `<span><span class="status ${r.status}">${r.status}</span></span>` +
+                `<span>${valuesStr}</span>` +
+                `<span>${link('covjson', 'CovJSON')} ${link('geojson', 'GeoJSON')}</span>` +
+                `</div>`;
+        }
+        
+        function renderVisible() {
+            renderScheduled = false;
+            const container = document.getElementById('collections');
+            const first = Math.floor(container.scrollTop / ROW_HEIGHT);
+            const visible = Math.ceil(container.clientHeight / ROW_HEIGHT);
+            const start = Math.max(0, first - OVERSCAN);
+            const end = Math.min(rows.length, first + visible + OVERSCAN);
+            const rowsEl = document.getElementById('rows');
+            rowsEl.style.transform = `translateY(${start * ROW_HEIGHT}px)`;
+            rowsEl.innerHTML = rows.slice(start, end).map(renderRow).join('');
+        }
+        
+        function scheduleRender() {
+            if (!renderScheduled) {
+                renderScheduled = true;
+                requestAnimationFrame(renderVisible);
+            }
+        }
+        
         async function loadFile(path, title) {
             document.getElementById('viewer-title').textContent = title;
             document.getElementById('viewer-meta').textContent = 'Loading...';
@@ -521,6 +1043,9 @@ class EDRProductDumper:
             try {
                 const resp = await fetch('results.json');
                 resultsData = await resp.json();
+                // Already grouped by collection when the dump was written
+                const byCollectionResp = await fetch('results_by_collection.json');
+                const byCollection = await byCollectionResp.json();
                 
                 // Update stats
                 document.getElementById('total').textContent = resultsData.stats.total;
@@ -530,53 +1055,34 @@ class EDRProductDumper:
                 document.getElementById('meta').textContent = 
                     `Endpoint: ${resultsData.endpoint} | Query: ${resultsData.query_type} | Time: ${resultsData.timestamp}`;
                 
-                // Group results by collection
-                const byCollection = {};
-                for (const r of resultsData.results) {
-                    if (!byCollection[r.collection]) {
-                        byCollection[r.collection] = [];
-                    }
-                    byCollection[r.collection].push(r);
-                }
-                
-                // Render collections
-                let html = '';
+                // Flatten into rows and render only the visible window
+                rows = [];
                 for (const [collId, results] of Object.entries(byCollection)) {
-                    html += `<div class="collection">`;
-                    html += `<h3>${collId}</h3>`;
-                    html += `<table class="results-table">`;
-                    html += `<tr><th>Parameter</th><th>Level</th><th>Status</th><th>Values</th><th>Files</th></tr>`;
-                    
+                    rows.push({ collection: collId, count: results.length });
                     for (const r of results) {
-                        const levelStr = r.level !== null ? r.level : '-';
-                        const valuesStr = r.non_null_count !== undefined 
-                            ? `${r.non_null_count}/${r.value_count}` 
-                            : '-';
-                        const filename = r.level !== null ? `${r.parameter}_z${r.level}` : r.parameter;
-                        
-                        html += `<tr>`;
-                        html += `<td>${r.parameter}</td>`;
-                        html += `<td>${levelStr}</td>`;
-                        html += `<td><span class="status ${r.status}">${r.status}</span></td>`;
-                        html += `<td>${valuesStr}</td>`;
-                        html += `<td>`;
-                        html += `<a href="#" onclick="loadFile('covjson/${collId}/${filename}.json', '${r.parameter} CovJSON'); return false;">covjson</a> `;
-                        html += `<a href="#" onclick="loadFile('geojson/${collId}/${filename}.json', '${r.parameter} GeoJSON'); return false;">geojson</a>`;
-                        html += `</td>`;
-                        html += `</tr>`;
+                        rows.push({ result: r });
                     }
-                    
-                    html += `</table>`;
-                    html += `</div>`;
                 }
-                
-                document.getElementById('collections').innerHTML = html;
+                document.getElementById('spacer').style.height = `${rows.length * ROW_HEIGHT}px`;
+                renderVisible();
                 
             } catch (e) {
                 document.getElementById('collections').innerHTML = '<p>Error loading results: ' + e.message + '</p>';
             }
         }
         
+        // One delegated listener for every file link, however many rows
+        const collectionsEl = document.getElementById('collections');
+        collectionsEl.addEventListener('click', e => {
+            const a = e.target.closest('a[data-path]');
+            if (a) {
+                e.preventDefault();
+                loadFile(a.dataset.path, a.dataset.title);
+            }
+        });
+        collectionsEl.addEventListener('scroll', scheduleRender);
+        window.addEventListener('resize', scheduleRender);
+        
         init();
     </script>
 </body>
@@ -618,6 +1124,17 @@ def main():
         default="both",
         help="Output format",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=20,
+        help="Max in-flight HTTP requests",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        help="Where metadata ETags are kept between runs "
+        f"(default: {DEFAULT_CACHE_ROOT}/<endpoint>)",
+    )
 
     args = parser.parse_args()
 
@@ -628,6 +1145,8 @@ def main():
         location_id=args.location,
         limit=args.limit,
         output_format=args.format,
+        concurrency=args.concurrency,
+        cache_dir=args.cache_dir,
     )
     dumper.run()
 
@@ -5,15 +5,23 @@ Run with: python3 server.py
 Then visit: http://localhost:8000
 """
 
+import email.utils
+import gzip
 import http.server
+import shutil
 import socket
 import socketserver
 import os
+from datetime import datetime, timezone
 from pathlib import Path
 
 PORT = 8000
 HANDLER = http.server.SimpleHTTPRequestHandler
 
+# JSON dumps compress well; level 1 keeps the CPU cost per request low
+GZIP_SUFFIXES = (".json",)
+GZIP_LEVEL = 1
+
 
 class MyHTTPRequestHandler(HANDLER):
     def end_headers(self):
@@ -27,6 +35,86 @@ class MyHTTPRequestHandler(HANDLER):
         self.send_response(200)
         self.end_headers()
 
+    def accepts_gzip(self):
+        """Return True if the request's Accept-Encoding allows gzip."""
+        # An explicit gzip entry takes precedence over "*", whatever the order
+        allowed = {}
+        for coding in self.headers.get("Accept-Encoding", "").split(","):
+            name, _, params = coding.partition(";")
+            name = name.strip().lower()
+            if name in ("gzip", "*"):
+                q = params.replace(" ", "").lower()
+                allowed[name] = q not in ("q=0", "q=0.0")
+        return allowed.get("gzip", allowed.get("*", False))
+
+    def not_modified_since(self, mtime):
+        """Return True if If-Modified-Since shows the client's copy is current.
+
+        Mirrors SimpleHTTPRequestHandler.send_head: an If-None-Match header
+        or an ill-formed date disables the check.
+        """
+        if "If-Modified-Since" not in self.headers or "If-None-Match" in self.headers:
+            return False
+        try:
+            ims = email.utils.parsedate_to_datetime(self.headers["If-Modified-Since"])
+        except (TypeError, IndexError, OverflowError, ValueError):
+            return False
+        if ims.tzinfo is None:
+            ims = ims.replace(tzinfo=timezone.utc)
+        if ims.tzinfo is not timezone.utc:
+            return False
+        last_modified = datetime.fromtimestamp(mtime, timezone.utc)
+        return last_modified.replace(microsecond=0) <= ims
+
+    def send_head(self):
+        """Gzip JSON files on the fly for clients that accept it."""
+        self.gzip_body = False
+        path = self.translate_path(self.path)
+        if (
+            not path.endswith(GZIP_SUFFIXES)
+            or not self.accepts_gzip()
+            or not os.path.isfile(path)
+        ):
+            return super().send_head()
+        try:
+            f = open(path, "rb")
+        except OSError:
+            return super().send_head()
+
+        mtime = os.fstat(f.fileno()).st_mtime
+        if self.not_modified_since(mtime):
+            f.close()
+            self.send_response(304)
+            self.send_header("Vary", "Accept-Encoding")
+            self.end_headers()
+            return None
+
+        self.send_response(200)
+        self.send_header("Content-Type", self.guess_type(path))
+        self.send_header("Content-Encoding", "gzip")
+        self.send_header("Vary", "Accept-Encoding")
+        self.send_header("Last-Modified", self.date_time_string(mtime))
+        # The compressed length isn't known up front; the body ends when the
+        # connection closes
+        self.close_connection = True
+        self.end_headers()
+        self.gzip_body = True
+        return f
+
+    def copyfile(self, source, outputfile):
+        """Send file bodies with sendfile(2) rather than copying through Python.
+
+        socket.sendfile falls back to plain sends for in-memory bodies such as
+        directory listings. Gzipped bodies are compressed as they stream.
+        """
+        if self.gzip_body:
+            with gzip.GzipFile(
+                fileobj=outputfile, mode="wb", compresslevel=GZIP_LEVEL
+            ) as gz:
+                shutil.copyfileobj(source, gz)
+            return
+        self.connection.sendfile(source)
+
     def translate_path(self, path):
         """Override to serve validation schemas from parent directory."""
         # Handle requests for /validation/schemas/ from parent directory
@@ -36,12 +124,16 @@ class MyHTTPRequestHandler(HANDLER):
         return super().translate_path(path)
 
 
-class DualStackTCPServer(socketserver.TCPServer):
-    """TCP Server that supports both IPv4 and IPv6."""
+class DualStackTCPServer(socketserver.ThreadingMixIn, socketserver.TCPServer):
+    """Threaded TCP Server that supports both IPv4 and IPv6."""
 
     # Allow IPv6 if available
     address_family = socket.AF_INET6
 
+    # Handle each connection on its own thread so one slow download doesn't
+    # hold up other dashboard requests; don't wait for them on shutdown
+    daemon_threads = True
+
     def server_bind(self):
         # Enable dual-stack (IPv4 + IPv6) on the socket
         # IPV6_V6ONLY=False allows the socket to accept both IPv4 and IPv6
@@ -66,7 +158,8 @@ if __name__ == "__main__":
         print(f"🚀 WMS Dashboard running at http://localhost:{PORT} (IPv4+IPv6)")
     except OSError:
         # Fall back to IPv4 only
-        httpd = socketserver.TCPServer(("", PORT), MyHTTPRequestHandler)
+        httpd = socketserver.ThreadingTCPServer(("", PORT), MyHTTPRequestHandler)
+        httpd.daemon_threads = True
         print(f"🚀 WMS Dashboard running at http://localhost:{PORT} (IPv4 only)")
 
     print(f"📁 Serving from: {web_dir}")